@@ -1,14 +1,38 @@
 """Gmail OAuth token validation for MCP Server."""
 
+import asyncio
+import hashlib
 import logging
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Tuple
 import httpx
-from pydantic import BaseModel
+import orjson
+from jose import JWTError, jwt
+from pydantic import BaseModel, model_validator
 
 from mcp.server.auth.provider import AccessToken, TokenVerifier
 
+from ..core.cache import TTLCache
+from ..core.config import get_settings
+from ..core.ratelimit import AsyncTokenBucket
+
 logger = logging.getLogger(__name__)
 
+# Seconds before a token's real expiry at which a cached validation is no longer trusted
+TOKEN_EXPIRY_LEEWAY = 60
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ("https://accounts.google.com", "accounts.google.com")
+# Google rotates signing keys roughly daily; an hour keeps new keys picked up quickly
+GOOGLE_CERTS_TTL = 3600
+
+_GMAIL_SCOPE_PREFIXES = ("https://www.googleapis.com/auth/gmail.",)
+
+
+def _has_gmail_scope(scope: str) -> bool:
+    """Check whether a space-separated scope string grants any Gmail scope."""
+    return any(s.startswith(_GMAIL_SCOPE_PREFIXES) for s in scope.split())
+
 
 class TokenInfo(BaseModel):
     """Token information from Gmail OAuth validation."""
@@ -17,7 +41,16 @@ class TokenInfo(BaseModel):
     email: str
     scope: str
     expires_in: Optional[int] = None
+    expires_at: Optional[int] = None  # Absolute expiry as a Unix timestamp
     token_type: str = "Bearer"
+    scopes: Tuple[str, ...] = ()
+
+    @model_validator(mode="after")
+    def _split_scopes(self) -> "TokenInfo":
+        """Split the scope string once so cached tokens reuse the parsed scopes."""
+        if self.scope and not self.scopes:
+            self.scopes = tuple(self.scope.split())
+        return self
 
 
 class TokenValidator:
@@ -25,43 +58,198 @@ class TokenValidator:
 
     def __init__(self):
         self.validation_url = "https://www.googleapis.com/oauth2/v1/tokeninfo"
+        self.settings = get_settings()
+        self._cache: TTLCache[TokenInfo] = TTLCache(
+            maxsize=self.settings.token_cache_maxsize, ttl=self.settings.token_cache_ttl
+        )
+        # Kept apart from the positive cache so rejected tokens expire on their own schedule
+        self._invalid: TTLCache[bool] = TTLCache(
+            maxsize=self.settings.token_cache_maxsize, ttl=self.settings.invalid_token_cache_ttl
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        # In-flight validations by token hash, so concurrent callers share one request
+        self._inflight: Dict[str, asyncio.Task[Optional[TokenInfo]]] = {}
+        # Bounds outbound tokeninfo calls so a cold cache cannot trip Google's rate limits
+        self._limiter = AsyncTokenBucket(max_rate=self.settings.rate_limit_requests, time_period=60)
+        self._certs: TTLCache[Dict[str, Any]] = TTLCache(maxsize=1, ttl=GOOGLE_CERTS_TTL)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        Returns:
+            Pooled HTTP/2 AsyncClient that keeps connections to Google warm between
+            validations
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(10.0),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @staticmethod
+    def _cache_key(token: str) -> str:
+        """Hash a token so raw credentials are never kept as cache keys."""
+        return hashlib.sha256(token.encode()).hexdigest()
 
     async def validate_token(self, token: str) -> Optional[TokenInfo]:
         """Validate Gmail OAuth token.
 
+        Successful validations are cached for ``min(expires_at - leeway - now, token_cache_ttl)``
+        seconds so repeat requests skip the round-trip to Google. Rejected tokens are
+        remembered for ``invalid_token_cache_ttl`` seconds. Concurrent calls for the
+        same token share a single outbound request.
+
+        Args:
+            token: OAuth access token
+
+        Returns:
+            TokenInfo if valid, None if invalid
+        """
+        key = self._cache_key(token)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        if key in self._invalid:
+            return None
+
+        task = self._inflight.get(key)
+        if task is None:
+            # Detached from the first caller, so its cancellation cannot fail the others
+            task = asyncio.create_task(self._fetch_token_info(token, key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _get_google_certs(self) -> Dict[str, Any]:
+        """Get Google's JWT signing keys, fetching them when the cached set expires.
+
+        Returns:
+            JWKS document from Google's certs endpoint
+        """
+        certs = self._certs.get(GOOGLE_CERTS_URL)
+        if certs is None:
+            response = await self._get_client().get(GOOGLE_CERTS_URL)
+            response.raise_for_status()
+            certs = orjson.loads(response.content)
+            self._certs.set(GOOGLE_CERTS_URL, certs)
+        return certs
+
+    async def _validate_jwt(self, token: str) -> Optional[TokenInfo]:
+        """Validate a Google-signed JWT locally against Google's published keys.
+
+        Only used when ``jwt_audience`` is configured, so that tokens minted for
+        other clients are never accepted.
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            TokenInfo if the token carries a Gmail scope, None otherwise
+
+        Raises:
+            JWTError: If the token is not a valid Google-signed JWT for this audience
+        """
+        claims = jwt.decode(
+            token,
+            await self._get_google_certs(),
+            algorithms=["RS256"],
+            audience=self.settings.jwt_audience,
+            issuer=GOOGLE_ISSUERS,
+            options={"verify_at_hash": False},
+        )
+
+        scope = claims.get("scope", "")
+        if not _has_gmail_scope(scope):
+            return None
+
+        expires_at = int(claims["exp"])
+        return TokenInfo(
+            access_token=token,
+            email=claims.get("email", ""),
+            scope=scope,
+            expires_in=expires_at - int(time.time()),
+            expires_at=expires_at,
+        )
+
+    async def _fetch_token_info(self, token: str, key: str) -> Optional[TokenInfo]:
+        """Validate a token against Google's tokeninfo endpoint and update the caches.
+
         Args:
             token: OAuth access token
+            key: Cache key for the token
 
         Returns:
             TokenInfo if valid, None if invalid
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.validation_url, params={"access_token": token}, timeout=10.0
-                )
+            token_info = None
+            if self.settings.jwt_audience and token.count(".") == 2:
+                try:
+                    token_info = await self._validate_jwt(token)
+                except JWTError:
+                    # Not a verifiable Google JWT, fall back to tokeninfo
+                    token_info = None
+                except httpx.HTTPError as e:
+                    # Signing keys are unavailable; tokeninfo can still vouch for the token
+                    logger.warning("Fetching Google signing keys failed, using tokeninfo: %s", e)
+                    token_info = None
+
+            if token_info is None:
+                client = self._get_client()
+                async with self._limiter:
+                    response = await client.get(
+                        self.validation_url, params={"access_token": token}
+                    )
 
                 if response.status_code != 200:
+                    # Throttling and server errors say nothing about the token itself
+                    if response.status_code != 429 and response.status_code < 500:
+                        self._invalid.set(key, True)
                     return None
 
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 # Ensure it's a Gmail token
                 scope = data.get("scope", "")
-                if "gmail" not in scope.lower():
+                if not _has_gmail_scope(scope):
+                    self._invalid.set(key, True)
                     return None
 
-                print("Data is: ", data)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Token validated for %s (scope=%s, expires_in=%s)",
+                        data.get("email", ""),
+                        scope,
+                        data.get("expires_in"),
+                    )
 
-                return TokenInfo(
+                expires_in = data.get("expires_in")
+                token_info = TokenInfo(
                     access_token=token,
                     email=data.get("email", ""),
                     scope=scope,
-                    expires_in=data.get("expires_in"),
+                    expires_in=expires_in,
+                    expires_at=int(time.time()) + int(expires_in) if expires_in else None,
                 )
 
+            ttl = self.settings.token_cache_ttl
+            if token_info.expires_at is not None:
+                ttl = min(token_info.expires_at - TOKEN_EXPIRY_LEEWAY - int(time.time()), ttl)
+            if ttl > 0:
+                self._cache.set(key, token_info, ttl=ttl)
+
+            return token_info
+
         except Exception as e:
-            logger.error(f"Token validation error: {e}")
+            logger.error("Token validation error: %s", e)
             return None
 
 
@@ -100,13 +288,13 @@ class GmailTokenVerifier(TokenVerifier):
             return AccessToken(
                 token=token,
                 client_id="gmail_client",  # Could be extracted from token_info if needed
-                scopes=token_info.scope.split() if token_info.scope else [],
-                # expires_at=token_info.expires_in,
+                scopes=list(token_info.scopes),
+                expires_at=token_info.expires_at,
                 # resource=token_info.email,  # Use email as resource identifier
             )
 
         except Exception as e:
-            logger.error(f"Gmail token verification error: {e}")
+            logger.error("Gmail token verification error: %s", e)
             return None
 
 
@@ -120,15 +308,13 @@ def extract_bearer_token(auth_header: Optional[str]) -> Optional[str]:
         Token if valid Bearer format, None otherwise
     """
 
-    print("Auth header is: ", auth_header)
-
     if not auth_header:
         return None
 
     if not auth_header.startswith("Bearer "):
         return None
 
-    return auth_header[7:]  # Remove "Bearer " prefix
+    return auth_header.removeprefix("Bearer ")
 
 
 # Create global instances
@@ -0,0 +1,85 @@
+"""Micro-batching of concurrent calls into one bulk operation."""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, List, Optional, Set, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncBatcher(Generic[T, R]):
+    """Coalesce items submitted close together into a single flush call.
+
+    A batch is flushed once ``max_batch_size`` items are pending or ``max_wait``
+    seconds after its first item arrived, whichever comes first. The flush
+    function returns one result per item, in order; an exception in a result
+    slot is raised to that item's caller only.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[T]], Awaitable[List[Union[R, BaseException]]]],
+        max_batch_size: int = 50,
+        max_wait: float = 0.02,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            flush: Coroutine function processing a batch of items
+            max_batch_size: Maximum number of items per flush
+            max_wait: Maximum seconds an item waits for others to join its batch
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._flush = flush
+        self._pending: List[Tuple[T, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        """Add an item to the current batch and wait for its result.
+
+        Args:
+            item: Item to process
+
+        Returns:
+            Result for this item
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._start_flush)
+
+        return await future
+
+    def _start_flush(self) -> None:
+        """Hand the pending items to a flush task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            # Keep a reference so the task is not garbage collected mid-flight
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        """Flush a batch and resolve each caller's future."""
+        try:
+            results = await self._flush([item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue  # Caller was cancelled
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
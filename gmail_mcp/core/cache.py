@@ -0,0 +1,134 @@
+"""In-process caching primitives for Gmail MCP server."""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, List, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Bounded LRU cache whose entries expire after a time-to-live.
+
+    Entries are evicted least-recently-used first once ``maxsize`` is reached, or
+    once the summed weight of the entries exceeds ``maxweight`` when one is given.
+    The cache is meant to be used from a single event loop and performs no locking.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        on_evict: Optional[Callable[[V], None]] = None,
+        maxweight: Optional[int] = None,
+        weigh: Optional[Callable[[V], int]] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Default time-to-live in seconds for new entries
+            on_evict: Called with each value dropped for expiring or for exceeding maxsize
+                or maxweight; values removed by pop() or clear() are left to the caller
+            maxweight: Maximum summed weight of the entries; a value heavier than this
+                on its own is not cached
+            weigh: Weight of a value (e.g. its size in bytes); required with maxweight
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.maxweight = maxweight
+        self._weigh = weigh
+        self._weight = 0
+        self._data: "OrderedDict[Hashable, tuple[float, V, int]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or an expired entry
+
+        Returns:
+            Cached value if present and not expired, otherwise default
+        """
+        item = self._data.get(key)
+        if item is None:
+            return default
+
+        expires_at, value, weight = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self._weight -= weight
+            if self.on_evict is not None:
+                self.on_evict(value)
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds, defaults to the cache TTL
+        """
+        if self.maxsize <= 0:
+            return
+
+        weight = self._weigh(value) if self._weigh is not None else 0
+        if self.maxweight is not None and weight > self.maxweight:
+            self.pop(key)
+            return
+
+        previous = self._data.get(key)
+        if previous is not None:
+            self._weight -= previous[2]
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value, weight)
+        self._data.move_to_end(key)
+        self._weight += weight
+
+        while len(self._data) > self.maxsize or (
+            self.maxweight is not None and self._weight > self.maxweight
+        ):
+            _, (_, evicted, evicted_weight) = self._data.popitem(last=False)
+            self._weight -= evicted_weight
+            if self.on_evict is not None:
+                self.on_evict(evicted)
+
+    def pop(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """Remove a value from the cache.
+
+        Args:
+            key: Cache key
+            default: Value returned if the key is not cached
+
+        Returns:
+            The removed value, or default
+        """
+        item = self._data.pop(key, None)
+        if item is None:
+            return default
+        self._weight -= item[2]
+        return item[1]
+
+    def values(self) -> List[V]:
+        """Get all stored values, including entries that have expired but not been evicted.
+
+        Returns:
+            List of stored values, least recently used first
+        """
+        return [value for _, value, _ in self._data.values()]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+        self._weight = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,4 +1,5 @@
 from enum import StrEnum
+from functools import lru_cache
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List, Optional
@@ -44,11 +45,48 @@ class Settings(BaseSettings):
         description="Required Gmail OAuth scopes",
     )
 
+    # Token validation cache
+    token_cache_ttl: int = Field(
+        default=300, description="Maximum seconds a validated token is cached"
+    )
+    token_cache_maxsize: int = Field(
+        default=10_000, description="Maximum number of validated tokens kept in cache"
+    )
+    invalid_token_cache_ttl: int = Field(
+        default=60, description="Seconds a rejected token is remembered as invalid"
+    )
+    rate_limit_requests: int = Field(
+        default=600, description="Maximum Google tokeninfo requests per minute"
+    )
+    jwt_audience: Optional[str] = Field(
+        default=None,
+        description="OAuth client ID expected as JWT audience; enables local JWT validation",
+    )
+
+    # Gmail service pool
+    service_cache_ttl: int = Field(
+        default=3300,
+        description="Seconds a GmailService is reused for the same token (about its lifetime)",
+    )
+    service_cache_maxsize: int = Field(
+        default=1024, description="Maximum number of pooled GmailService instances"
+    )
+
+    # Worker threads for blocking Gmail API calls and large serializations
+    thread_pool_size: int = Field(
+        default=16, description="Maximum threads in the event loop's default executor"
+    )
+
     # Transport type for MCP server
     transport_type: TransportType = Field(
         default=TransportType.STREAMABLE_HTTP, description="Transport type for MCP server"
     )
 
+    # Tool output
+    pretty_json: bool = Field(
+        default=False, description="Indent tool JSON responses (for debugging)"
+    )
+
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
     log_format: str = Field(
@@ -56,5 +94,11 @@ class Settings(BaseSettings):
     )
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, loading them from the environment on first use.
+
+    Returns:
+        Shared Settings instance
+    """
+    return Settings()
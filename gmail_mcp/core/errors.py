@@ -0,0 +1,27 @@
+"""Error logging for Gmail MCP tools."""
+
+import logging
+
+from fastapi import HTTPException
+
+
+def log_tool_error(logger: logging.Logger, tool_name: str, error: Exception) -> None:
+    """Log an exception raised while running a tool.
+
+    Gmail API errors (e.g. a 404 for an unknown message ID) and auth errors are routine,
+    so they get a one-line warning; anything else is logged with its traceback.
+
+    Args:
+        logger: Logger of the tool module
+        tool_name: Name of the failing tool
+        error: Exception raised by the tool
+    """
+    # Imported on the error path only, like the rest of googleapiclient
+    from googleapiclient.errors import HttpError
+
+    if isinstance(error, HttpError):
+        logger.warning("Gmail API error in %s: %s %s", tool_name, error.status_code, error.reason)
+    elif isinstance(error, HTTPException):
+        logger.warning("Error in %s: %s %s", tool_name, error.status_code, error.detail)
+    else:
+        logger.error("Error in %s: %s", tool_name, error, exc_info=error)
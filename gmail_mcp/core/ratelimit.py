@@ -0,0 +1,50 @@
+"""Rate limiting primitives for outbound requests."""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """Async token-bucket rate limiter.
+
+    Allows bursts of up to ``max_rate`` acquisitions and refills at
+    ``max_rate / time_period`` tokens per second. Waiters are served in order.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """Initialize the limiter.
+
+        Args:
+            max_rate: Maximum number of acquisitions per time period
+            time_period: Length of the time period in seconds
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._refill_rate = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.max_rate), self._tokens + (now - self._last_refill) * self._refill_rate
+        )
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
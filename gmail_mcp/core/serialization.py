@@ -0,0 +1,90 @@
+"""JSON serialization of tool results."""
+
+from typing import Any
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+
+from .config import get_settings
+
+
+def dumps(obj: Any) -> str:
+    """Serialize a tool result to a compact JSON string with orjson.
+
+    Output is indented only when the pretty_json setting is enabled. There is no
+    ``default`` fallback: models are embedded with model_fragment, so every value is
+    a type orjson encodes natively.
+
+    Args:
+        obj: JSON-compatible object; datetimes, enums and fragments are handled natively
+
+    Returns:
+        JSON string
+    """
+    option = orjson.OPT_NAIVE_UTC
+    if get_settings().pretty_json:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, option=option).decode()
+
+
+def model_fragment(model: BaseModel) -> orjson.Fragment:
+    """Serialize a model to a JSON fragment that dumps embeds as-is.
+
+    Args:
+        model: Model to serialize
+
+    Returns:
+        Fragment holding the model's compact JSON
+    """
+    return orjson.Fragment(model.__pydantic_serializer__.to_json(model))
+
+
+def dumps_model(model: BaseModel) -> str:
+    """Serialize a model to JSON with its pydantic-core serializer.
+
+    Skips building the intermediate dict that dumps(model.model_dump()) would need, and
+    calls the compiled serializer directly rather than through model_dump_json, whose
+    keyword handling is repeated on every call.
+
+    Args:
+        model: Model to serialize
+
+    Returns:
+        JSON string
+    """
+    indent = 2 if get_settings().pretty_json else None
+    return model.__pydantic_serializer__.to_json(model, indent=indent).decode()
+
+
+def dumps_adapted(adapter: TypeAdapter, value: Any) -> str:
+    """Serialize a value to JSON with a prebuilt TypeAdapter.
+
+    Adapters compile their serializer on construction, so callers keep one per type
+    at module scope.
+
+    Args:
+        adapter: Adapter for the value's type
+        value: Value to serialize
+
+    Returns:
+        JSON string
+    """
+    return adapter.dump_json(value, indent=2 if get_settings().pretty_json else None).decode()
+
+
+def render(template: str, **fields: Any) -> str:
+    """Fill a pre-serialized response template with JSON-encoded field values.
+
+    Lets fixed-shape responses skip building a dict and walking it in the encoder.
+
+    Args:
+        template: Envelope with one {placeholder} per field
+        **fields: Field values to encode and splice in
+
+    Returns:
+        JSON string
+    """
+    text = template.format(**{name: orjson.dumps(value).decode() for name, value in fields.items()})
+    if get_settings().pretty_json:
+        return dumps(orjson.loads(text))
+    return text
@@ -1,12 +1,27 @@
 """Dependency injection functions for MCP tools."""
 
+import hashlib
+
 from fastapi import HTTPException, Depends
 from mcp.server.fastmcp.server import Context
 from starlette.requests import Request
 
 from gmail_mcp.auth import TokenInfo
 
-from .services import GmailService
+from .core.cache import TTLCache
+from .core.config import get_settings
+from .services import GmailService, close_shared_transport
+
+_AUTHORIZATION_HEADER = b"authorization"
+_BEARER_PREFIX = b"Bearer "
+
+# GmailService instances keyed by token hash, so repeat calls reuse the built API client
+# without keeping raw tokens as keys; evicted services are closed to stop their prefetches
+_service_cache: TTLCache[GmailService] = TTLCache(
+    maxsize=get_settings().service_cache_maxsize,
+    ttl=get_settings().service_cache_ttl,
+    on_evict=GmailService.close,
+)
 
 
 def get_access_token(ctx: Context) -> str:
@@ -25,26 +40,74 @@ def get_access_token(ctx: Context) -> str:
         raise HTTPException(status_code=401, detail="No request context available")
 
     request: Request = ctx.request_context.request
-    auth_header = request.headers.get("Authorization")
 
-    if not auth_header or not auth_header.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="No valid access token provided")
+    # Check the raw ASGI header bytes so only the token itself gets decoded
+    for name, value in request.headers.raw:
+        if name == _AUTHORIZATION_HEADER:
+            if value.startswith(_BEARER_PREFIX):
+                return value[len(_BEARER_PREFIX) :].decode("latin-1")
+            break
 
-    return auth_header.replace("Bearer ", "")
+    raise HTTPException(status_code=401, detail="No valid access token provided")
 
 
 def get_gmail_service(access_token: str = Depends(get_access_token)) -> GmailService:
     """Get GmailService instance with access token.
 
+    Services are pooled per token so repeated tool calls reuse the same Gmail API client.
+
     Args:
         access_token: OAuth access token
 
     Returns:
         Configured GmailService instance
     """
-    token_info = TokenInfo(
-        access_token=access_token,
-        email="",  # Email can be fetched if needed
-        scope="",  # Scope can be fetched if needed
-    )
-    return GmailService(token_info=token_info)
+    key = hashlib.blake2b(access_token.encode(), digest_size=16).digest()
+    service = _service_cache.get(key)
+    if service is None:
+        token_info = TokenInfo(
+            access_token=access_token,
+            email="",  # Email can be fetched if needed
+            scope="",  # Scope can be fetched if needed
+        )
+        service = GmailService(token_info=token_info)
+        _service_cache.set(key, service)
+    return service
+
+
+def get_context_gmail_service(ctx: Context) -> GmailService:
+    """Get the pooled GmailService for the access token in an MCP context.
+
+    The service is remembered on the HTTP request's state, so further lookups during
+    the same tool call skip the header scan and token hashing.
+
+    Args:
+        ctx: MCP context containing request information
+
+    Returns:
+        Configured GmailService instance
+
+    Raises:
+        HTTPException: If no valid token is found
+    """
+    request = ctx.request_context.request if ctx and ctx.request_context else None
+    if request is not None:
+        service = getattr(request.state, "gmail_service", None)
+        if service is not None:
+            return service
+
+    service = get_gmail_service(access_token=get_access_token(ctx))
+    if request is not None:
+        request.state.gmail_service = service
+    return service
+
+
+def close_gmail_services() -> None:
+    """Close and drop every pooled GmailService and the connections they share.
+
+    Called on server shutdown so pooled keep-alive connections are released promptly.
+    """
+    for service in _service_cache.values():
+        service.close()
+    _service_cache.clear()
+    close_shared_transport()
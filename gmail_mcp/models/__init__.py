@@ -21,6 +21,8 @@ from .models import (
     ForwardEmailRequest,
     ApiResponse,
     EmailListResponse,
+    EmailBatchResponse,
+    EmailListResponseColumnar,
     ThreadListResponse,
     DraftListResponse,
     LabelListResponse,
@@ -49,6 +51,8 @@ __all__ = [
     "ForwardEmailRequest",
     "ApiResponse",
     "EmailListResponse",
+    "EmailBatchResponse",
+    "EmailListResponseColumnar",
     "ThreadListResponse",
     "DraftListResponse",
     "LabelListResponse",
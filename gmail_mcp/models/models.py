@@ -1,9 +1,30 @@
+import sys
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field, ConfigDict
+from typing import List, Optional, Dict, Any, Self, Tuple, Union
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 from enum import StrEnum
 
 
+# Header names that repeat on nearly every message, interned so instances share one string
+_HEADER_INTERN = {
+    name: sys.intern(name)
+    for name in (
+        "From",
+        "To",
+        "Cc",
+        "Bcc",
+        "Subject",
+        "Date",
+        "Message-ID",
+        "In-Reply-To",
+        "References",
+        "Content-Type",
+        "Content-Transfer-Encoding",
+        "MIME-Version",
+    )
+}
+
+
 class CaseInsensitiveStrEnum(StrEnum):
     """Case insensitive string enum."""
 
@@ -44,7 +65,7 @@ class ThreadFormat(CaseInsensitiveStrEnum):
 class AttachmentData(BaseModel):
     """Gmail attachment data model."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     attachment_id: str = Field(..., description="Attachment ID")
     size: int = Field(..., description="Attachment size in bytes")
@@ -54,29 +75,55 @@ class AttachmentData(BaseModel):
 class MessagePart(BaseModel):
     """Gmail message part model."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     part_id: Optional[str] = Field(None, description="Part ID")
     mime_type: str = Field(..., description="MIME type")
     filename: Optional[str] = Field(None, description="Filename for attachments")
-    headers: List[Dict[str, str]] = Field(default_factory=list, description="Message headers")
+    headers: List[Tuple[str, str]] = Field(
+        default_factory=list, description="Message headers as (name, value) pairs"
+    )
     body: Optional[Dict[str, Any]] = Field(None, description="Message body")
-    parts: Optional[List["MessagePart"]] = Field(None, description="Sub-parts")
+    parts: Optional[List[Self]] = Field(None, description="Sub-parts")
+
+    @field_validator("headers", mode="before")
+    @classmethod
+    def _headers_to_pairs(cls, value: Any) -> Any:
+        """Accept Gmail API header dicts and store them as (name, value) pairs."""
+        if isinstance(value, list):
+            return [
+                (_HEADER_INTERN.get(header["name"], header["name"]), header["value"])
+                if isinstance(header, dict)
+                else header
+                for header in value
+            ]
+        return value
+
+    @property
+    def header_dict(self) -> Dict[str, str]:
+        """Headers as a name -> value mapping, built on demand."""
+        return dict(self.headers)
 
 
 class MessageHeader(BaseModel):
     """Gmail message header model."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     name: str = Field(..., description="Header name")
     value: str = Field(..., description="Header value")
 
+    @field_validator("name")
+    @classmethod
+    def _intern_name(cls, value: str) -> str:
+        """Share one string object for common header names."""
+        return _HEADER_INTERN.get(value, value)
+
 
 class Label(BaseModel):
     """Gmail label model."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     id: str = Field(..., description="Label ID")
     name: str = Field(..., description="Label name")
@@ -92,7 +139,7 @@ class Label(BaseModel):
 class Message(BaseModel):
     """Gmail message model."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     id: str = Field(..., description="Message ID")
     thread_id: str = Field(..., description="Thread ID")
@@ -108,6 +155,7 @@ class Message(BaseModel):
     subject: Optional[str] = Field(None, description="Message subject")
     sender: Optional[str] = Field(None, description="Message sender")
     recipient: Optional[str] = Field(None, description="Message recipient")
+    cc: Optional[str] = Field(None, description="Message CC recipients")
     date: Optional[datetime] = Field(None, description="Message date")
     body_text: Optional[str] = Field(None, description="Plain text body")
     body_html: Optional[str] = Field(None, description="HTML body")
@@ -117,7 +165,7 @@ class Message(BaseModel):
 class Thread(BaseModel):
     """Gmail thread model."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     id: str = Field(..., description="Thread ID")
     snippet: Optional[str] = Field(None, description="Thread snippet")
@@ -128,7 +176,7 @@ class Thread(BaseModel):
 class Draft(BaseModel):
     """Gmail draft model."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     id: str = Field(..., description="Draft ID")
     message: Message = Field(..., description="Draft message")
@@ -137,7 +185,7 @@ class Draft(BaseModel):
 class Profile(BaseModel):
     """Gmail profile model."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     email_address: str = Field(..., description="Email address")
     messages_total: int = Field(..., description="Total messages")
@@ -151,7 +199,7 @@ class Profile(BaseModel):
 class SendEmailRequest(BaseModel):
     """Request model for sending emails."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     to: List[str] = Field(..., description="Recipient email addresses")
     cc: Optional[List[str]] = Field(None, description="CC recipients")
@@ -167,7 +215,7 @@ class SendEmailRequest(BaseModel):
 class SearchEmailsRequest(BaseModel):
     """Request model for searching emails."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     query: str = Field(..., description="Gmail search query")
     max_results: int = Field(default=10, ge=1, le=500, description="Maximum results")
@@ -191,7 +239,7 @@ class SearchEmailsRequest(BaseModel):
 class EmailListRequest(BaseModel):
     """Request model for listing emails."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     max_results: int = Field(default=10, ge=1, le=500, description="Maximum results")
     label_ids: Optional[List[str]] = Field(None, description="Filter by label IDs")
@@ -215,7 +263,7 @@ class EmailListRequest(BaseModel):
 class ModifyLabelsRequest(BaseModel):
     """Request model for modifying message labels."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     add_label_ids: Optional[List[str]] = Field(None, description="Label IDs to add")
     remove_label_ids: Optional[List[str]] = Field(None, description="Label IDs to remove")
@@ -224,7 +272,7 @@ class ModifyLabelsRequest(BaseModel):
 class CreateLabelRequest(BaseModel):
     """Request model for creating labels."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     name: str = Field(..., description="Label name")
     message_list_visibility: str = Field(default="show", description="Message list visibility")
@@ -234,7 +282,7 @@ class CreateLabelRequest(BaseModel):
 class ForwardEmailRequest(BaseModel):
     """Request model for forwarding emails."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     to: List[str] = Field(..., description="Recipient email addresses")
     cc: Optional[List[str]] = Field(None, description="CC recipients")
@@ -245,7 +293,7 @@ class ForwardEmailRequest(BaseModel):
 class CreateDraftRequest(BaseModel):
     """Request model for creating drafts."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     to: List[str] = Field(..., description="Recipient email addresses")
     cc: Optional[List[str]] = Field(None, description="CC recipients")
@@ -260,7 +308,7 @@ class CreateDraftRequest(BaseModel):
 class ThreadListRequest(BaseModel):
     """Request model for listing threads."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     label_ids: Optional[List[str]] = Field(None, description="Filter by label IDs")
     q: Optional[str] = Field(None, description="Search query")
@@ -272,12 +320,15 @@ class ThreadListRequest(BaseModel):
     )
     after: Optional[str] = Field(None, description="Show threads after this date (YYYY/MM/DD)")
     before: Optional[str] = Field(None, description="Show threads before this date (YYYY/MM/DD)")
+    expand_bodies: bool = Field(
+        default=False, description="Fetch message bodies for compact threads, not just headers"
+    )
 
 
 class DraftListRequest(BaseModel):
     """Request model for listing drafts."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     max_results: int = Field(default=10, ge=1, le=500, description="Maximum results")
     page_token: Optional[str] = Field(None, description="Page token for pagination")
@@ -295,7 +346,7 @@ class DraftListRequest(BaseModel):
 class ApiResponse(BaseModel):
     """Base API response model."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     success: bool = Field(..., description="Operation success status")
     message: str = Field(..., description="Response message")
@@ -305,17 +356,48 @@ class ApiResponse(BaseModel):
 class EmailListResponse(BaseModel):
     """Response model for email listing."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     messages: List[Message] = Field(..., description="List of messages")
     next_page_token: Optional[str] = Field(None, description="Next page token")
     result_size_estimate: Optional[int] = Field(None, description="Estimated result size")
 
 
+class EmailBatchResponse(BaseModel):
+    """Response model for fetching several emails by ID."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
+
+    messages: List[Message] = Field(..., description="Fetched messages, in request order")
+    errors: Dict[str, str] = Field(
+        default_factory=dict, description="Error per message ID that could not be fetched"
+    )
+
+
+class EmailListResponseColumnar(BaseModel):
+    """Response model for email listing with one list per field."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
+
+    ids: List[str] = Field(..., description="Message IDs")
+    thread_ids: List[str] = Field(..., description="Thread IDs")
+    label_ids: List[List[str]] = Field(..., description="Label IDs per message")
+    snippets: List[Optional[str]] = Field(..., description="Message snippets")
+    dates: List[Optional[datetime]] = Field(..., description="Message dates")
+    subjects: Optional[List[Optional[str]]] = Field(None, description="Subjects (compact only)")
+    senders: Optional[List[Optional[str]]] = Field(None, description="Senders (compact only)")
+    recipients: Optional[List[Optional[str]]] = Field(
+        None, description="Recipients (compact only)"
+    )
+    body_texts: Optional[List[str]] = Field(None, description="Plain text bodies (compact only)")
+    next_page_token: Optional[str] = Field(None, description="Next page token")
+    result_size_estimate: Optional[int] = Field(None, description="Estimated result size")
+
+
 class ThreadListResponse(BaseModel):
     """Response model for thread listing."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     threads: List[Thread] = Field(..., description="List of threads")
     next_page_token: Optional[str] = Field(None, description="Next page token")
@@ -325,7 +407,7 @@ class ThreadListResponse(BaseModel):
 class LabelListResponse(BaseModel):
     """Response model for label listing."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     labels: List[Label] = Field(..., description="List of labels")
 
@@ -333,12 +415,8 @@ class LabelListResponse(BaseModel):
 class DraftListResponse(BaseModel):
     """Response model for draft listing."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     drafts: List[Draft] = Field(..., description="List of drafts")
     next_page_token: Optional[str] = Field(None, description="Next page token")
     result_size_estimate: Optional[int] = Field(None, description="Estimated result size")
-
-
-# Fix forward references
-MessagePart.model_rebuild()
@@ -1,3 +1,3 @@
-from .gmail_service import GmailService
+from .gmail_service import GmailService, close_shared_transport
 
-__all__ = ["GmailService"]
+__all__ = ["GmailService", "close_shared_transport"]
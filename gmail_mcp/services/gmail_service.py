@@ -1,17 +1,20 @@
-from typing import List, Optional, Dict, Any
-import base64
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+from typing import TYPE_CHECKING, Awaitable, Callable, List, Optional, Dict, Any, Tuple, Union
+import asyncio
+from email import policy
+from email.errors import HeaderParseError
+from email.generator import BytesGenerator
+from email.headerregistry import Address
+from email.message import EmailMessage
+from email.utils import formataddr, getaddresses
+from io import BytesIO
+import mmap
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
+from functools import lru_cache
 
-from googleapiclient.discovery import build
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from pydantic import BaseModel
+import orjson
+import pybase64
 
 from ..models import (
     Message,
@@ -33,15 +36,182 @@ from ..models import (
     ThreadListRequest,
     DraftListRequest,
     EmailListResponse,
+    EmailListResponseColumnar,
     ThreadListResponse,
     LabelListResponse,
     DraftListResponse,
 )
 from ..auth import TokenInfo
+from ..core.batching import AsyncBatcher
+from ..core.cache import TTLCache
+
+# googleapiclient and its transports are imported where first used, so importing
+# this module (e.g. for MCP tool discovery) does not pay for them
+if TYPE_CHECKING:
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.http import HttpRequest
+
+    from .transport import HttpxTransport
 
 
 logger = logging.getLogger(__name__)
 
+# Gmail accepts up to 100 calls per batch but recommends 50 to avoid rate limiting
+GMAIL_BATCH_SIZE = 50
+# Upper bound on batch requests in flight at once, to stay within per-user rate limits
+GMAIL_MAX_CONCURRENT_BATCHES = 8
+# Maximum message IDs accepted by a single messages.batchModify call
+GMAIL_BATCH_MODIFY_LIMIT = 1000
+# Seconds a draft, send or label change waits for concurrent calls to share its batch
+MICRO_BATCH_MAX_WAIT = 0.02
+# Timeout in seconds for Gmail API requests
+GMAIL_HTTP_TIMEOUT = 30
+# Timeout in seconds for opening a connection, so an unreachable host fails fast
+GMAIL_CONNECT_TIMEOUT = 5
+
+# Message content is immutable by ID; the TTL only bounds staleness of label changes
+# made by other clients
+MESSAGE_CACHE_SIZE = 512
+MESSAGE_CACHE_TTL = 300
+# Downloaded attachments are cached once for the whole process and bounded by their
+# encoded size, so the memory they pin does not grow with the number of pooled services
+ATTACHMENT_CACHE_SIZE = 256
+ATTACHMENT_CACHE_BYTES = 64 * 1024 * 1024
+# threads.list pages are cached briefly; this service's own writes clear them
+THREAD_LIST_CACHE_SIZE = 64
+THREAD_LIST_CACHE_TTL = 30
+# Parsed threads are keyed by history ID, which changes whenever the thread does
+THREAD_CACHE_SIZE = 256
+# The page after each thread or draft listing is fetched speculatively and kept this long
+PREFETCH_CACHE_SIZE = 4
+PREFETCH_TTL = 30
+# Seconds a created label answers repeated creates of the same name without an API call
+CREATED_LABEL_TTL = 600
+CREATED_LABEL_CACHE_SIZE = 64
+# Seconds an encoded reading tool response answers identical repeat calls
+RESPONSE_CACHE_TTL = 10
+RESPONSE_CACHE_SIZE = 64
+# Serialized threads and drafts, reused while their history ID is unchanged
+FRAGMENT_CACHE_TTL = 300
+FRAGMENT_CACHE_SIZE = 1_000
+
+# Headers _parse_message exposes on Message (lowercased)
+MESSAGE_HEADERS = frozenset({"subject", "from", "to", "cc"})
+# Headers requested for thread summaries fetched in metadata format
+THREAD_METADATA_HEADERS = ["Subject", "From", "To", "Date"]
+# Partial-response masks for list calls, whose items are only used for their IDs
+# (and history IDs, which validate cached threads)
+MESSAGE_LIST_FIELDS = "messages(id),nextPageToken,resultSizeEstimate"
+THREAD_LIST_FIELDS = "threads(id,historyId),nextPageToken,resultSizeEstimate"
+DRAFT_LIST_FIELDS = "drafts(id),nextPageToken,resultSizeEstimate"
+# MIME part levels projected by the part masks below (deeper parts come back whole)
+PART_MASK_DEPTH = 4
+# Partial-response mask for listing attachments: filename and attachment body of each part
+_ATTACHMENT_PART_FIELDS = "filename,body(attachmentId,size),parts"
+ATTACHMENT_FIELDS = (
+    "payload("
+    + f"{_ATTACHMENT_PART_FIELDS}(" * PART_MASK_DEPTH
+    + _ATTACHMENT_PART_FIELDS
+    + ")" * (PART_MASK_DEPTH + 1)
+)
+# Partial-response mask for compact messages, fetched in full format: the message fields,
+# top-level headers and the type and inline data of each part, which is all
+# _parse_message_compact reads
+_COMPACT_PART_FIELDS = "mimeType,body/data,parts"
+COMPACT_MESSAGE_FIELDS = (
+    "id,threadId,labelIds,snippet,historyId,internalDate,sizeEstimate,payload(headers,"
+    + f"{_COMPACT_PART_FIELDS}(" * PART_MASK_DEPTH
+    + _COMPACT_PART_FIELDS
+    + ")" * (PART_MASK_DEPTH + 1)
+)
+
+
+def _error_detail(error: Exception) -> str:
+    """Describe a failed Gmail API request in one line.
+
+    Args:
+        error: Exception raised for the request
+
+    Returns:
+        The HttpError reason (e.g. "Requested entity was not found."), else str(error)
+    """
+    return getattr(error, "reason", None) or str(error)
+
+
+def _message_get_params(format: str) -> Dict[str, str]:
+    """Build messages.get format arguments for one of our message formats.
+
+    Args:
+        format: Message format (minimal, compact, full, raw, metadata)
+
+    Returns:
+        Keyword arguments for messages().get() besides the user and message ID
+    """
+    if format == "compact":
+        # Gmail has no compact format: fetch full, trimmed to the fields compact reads
+        return {"format": "full", "fields": COMPACT_MESSAGE_FIELDS}
+    return {"format": format}
+
+
+@lru_cache(maxsize=1)
+def _gmail_discovery_doc() -> Dict[str, Any]:
+    """Load the Gmail v1 discovery document bundled with googleapiclient.
+
+    Parsed once per process and shared by every GmailService.
+
+    Returns:
+        Parsed discovery document
+    """
+    from googleapiclient.discovery_cache import get_static_doc
+
+    return orjson.loads(get_static_doc("gmail", "v1"))
+
+
+# (owning service, message ID, attachment ID) -> downloaded attachment, for every service
+_attachment_cache: TTLCache[AttachmentData] = TTLCache(
+    maxsize=ATTACHMENT_CACHE_SIZE,
+    ttl=MESSAGE_CACHE_TTL,
+    maxweight=ATTACHMENT_CACHE_BYTES,
+    weigh=lambda attachment: len(attachment.data or ""),
+)
+
+
+@lru_cache(maxsize=1)
+def _shared_transport() -> "HttpxTransport":
+    """Create the HTTP/2 transport shared by every GmailService.
+
+    Each service adds its own credentials per request, so pooled services for
+    different tokens reuse the same connections to gmail.googleapis.com.
+
+    Returns:
+        Process-wide transport
+    """
+    from .transport import HttpxTransport
+
+    return HttpxTransport(timeout=GMAIL_HTTP_TIMEOUT, connect_timeout=GMAIL_CONNECT_TIMEOUT)
+
+
+def close_shared_transport() -> None:
+    """Close the shared transport's connections; later requests open a new one."""
+    if _shared_transport.cache_info().currsize:
+        _shared_transport().close()
+        _shared_transport.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _timestamp_to_datetime(seconds: int) -> datetime:
+    """Convert a Unix timestamp to a UTC datetime, memoized per second.
+
+    Messages in a listing or thread often share a timestamp second.
+
+    Args:
+        seconds: Unix timestamp in whole seconds
+
+    Returns:
+        Timezone-aware UTC datetime
+    """
+    return datetime.fromtimestamp(seconds, tz=timezone.utc)
+
 
 class GmailService:
     """Gmail API service wrapper."""
@@ -52,103 +222,356 @@ class GmailService:
         Args:
             token_info: Valid token information
         """
+        from google.oauth2.credentials import Credentials
+        from googleapiclient.discovery import build_from_document
+
         self.token_info = token_info
+        # Fetched from the profile on first use when the token info does not carry it
+        self._email_address: Optional[str] = token_info.email or None
         self.credentials = Credentials(token=token_info.access_token)
-        self.service = build("gmail", "v1", credentials=self.credentials)
+        # Shared by direct calls and batches running in worker threads
+        self._http = self._new_http()
+        self.service = build_from_document(_gmail_discovery_doc(), http=self._http)
+        self._message_cache: TTLCache[Message] = TTLCache(
+            maxsize=MESSAGE_CACHE_SIZE, ttl=MESSAGE_CACHE_TTL
+        )
+        # (message ID, format) -> fetch in flight, awaited by every concurrent caller
+        self._message_fetches: Dict[Tuple[str, str], asyncio.Future] = {}
+        # Owner part of this service's keys in the shared attachment cache; a unique
+        # object, so a later service can never read attachments cached for another token
+        self._attachment_owner = object()
+        self._thread_list_cache: TTLCache[Dict[str, Any]] = TTLCache(
+            maxsize=THREAD_LIST_CACHE_SIZE, ttl=THREAD_LIST_CACHE_TTL
+        )
+        self._thread_cache: TTLCache[Thread] = TTLCache(
+            maxsize=THREAD_CACHE_SIZE, ttl=MESSAGE_CACHE_TTL
+        )
+        # (listing kind, request JSON) -> task fetching that page ahead of the caller
+        self._prefetched: TTLCache[asyncio.Task] = TTLCache(
+            maxsize=PREFETCH_CACHE_SIZE, ttl=PREFETCH_TTL
+        )
+        # Label ID -> (raw API fields, Label) so unchanged labels are not rebuilt
+        self._label_cache: Dict[str, Tuple[Tuple[Any, ...], Label]] = {}
+        self._labels_by_name: Dict[str, Label] = {}
+        # Label name -> label created through this service, so retried creates are no-ops
+        self._created_labels: TTLCache[Label] = TTLCache(
+            maxsize=CREATED_LABEL_CACHE_SIZE, ttl=CREATED_LABEL_TTL
+        )
+        # (tool name, arguments) -> encoded response of a reading tool, dropped on any write
+        self.response_cache: TTLCache[str] = TTLCache(
+            maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL
+        )
+        # (kind, ID, history ID, output options) -> JSON of a thread or draft
+        self.fragment_cache: TTLCache[orjson.Fragment] = TTLCache(
+            maxsize=FRAGMENT_CACHE_SIZE, ttl=FRAGMENT_CACHE_TTL
+        )
+        self._parsers = {
+            MessageFormat.MINIMAL.value: self._parse_message_minimal,
+            MessageFormat.COMPACT.value: self._parse_message_compact,
+        }
+        # Bursts of writes from one client are coalesced into batch requests
+        self._draft_batcher: AsyncBatcher[Dict[str, Any], Dict[str, Any]] = AsyncBatcher(
+            self._create_drafts, max_batch_size=GMAIL_BATCH_SIZE, max_wait=MICRO_BATCH_MAX_WAIT
+        )
+        self._send_batcher: AsyncBatcher[Dict[str, Any], Dict[str, Any]] = AsyncBatcher(
+            self._send_messages, max_batch_size=GMAIL_BATCH_SIZE, max_wait=MICRO_BATCH_MAX_WAIT
+        )
+        self._modify_batcher: AsyncBatcher[Tuple[str, Dict[str, Any]], Dict[str, Any]] = (
+            AsyncBatcher(
+                self._modify_messages,
+                max_batch_size=GMAIL_BATCH_SIZE,
+                max_wait=MICRO_BATCH_MAX_WAIT,
+            )
+        )
 
-    def _parse_message_headers(self, headers: List[Dict[str, str]]) -> Dict[str, str]:
-        """Parse message headers into a dictionary.
+    def _new_http(self) -> "AuthorizedHttp":
+        """Create an authorized view of the shared HTTP/2 transport for Gmail API calls.
+
+        Returns:
+            AuthorizedHttp bound to this service's credentials
+        """
+        from google_auth_httplib2 import AuthorizedHttp
+
+        return AuthorizedHttp(self.credentials, http=_shared_transport())
+
+    def close(self) -> None:
+        """Cancel this service's background work.
+
+        Connections belong to the shared transport; see close_shared_transport().
+        """
+        self._invalidate_listings()
+
+    def _invalidate_listings(self) -> None:
+        """Drop cached and prefetched listings and tool responses after a write."""
+        self._thread_list_cache.clear()
+        self.response_cache.clear()
+        for task in self._prefetched.values():
+            task.cancel()
+        self._prefetched.clear()
+
+    def _invalidate_message(self, message_id: str) -> None:
+        """Drop every cached format of a message and any thread listings it may appear in.
 
         Args:
-            headers: List of header dictionaries
+            message_id: Message ID
+        """
+        for message_format in MessageFormat:
+            self._message_cache.pop((message_id, message_format.value))
+        self._invalidate_listings()
+
+    async def _execute_batch(
+        self, requests: List["HttpRequest"], return_exceptions: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Execute Gmail API requests through the batch endpoint.
+
+        Batches run in worker threads over the shared thread-safe transport, so large
+        result sets are fetched concurrently without blocking the event loop.
+
+        Args:
+            requests: Prepared Gmail API requests
+            return_exceptions: Put each failed request's exception in its result slot
+                instead of raising
 
         Returns:
-            Dictionary of header name -> value
+            Responses in the same order as the requests
+
+        Raises:
+            HttpError: If any request in the batch fails and return_exceptions is False
         """
-        return {header["name"].lower(): header["value"] for header in headers}
+        responses: List[Optional[Union[Dict[str, Any], Exception]]] = [None] * len(requests)
+        errors: List[Exception] = []
+        semaphore = asyncio.Semaphore(GMAIL_MAX_CONCURRENT_BATCHES)
+
+        def callback(
+            request_id: str, response: Dict[str, Any], exception: Optional[Exception]
+        ) -> None:
+            if exception is not None:
+                errors.append(exception)
+                responses[int(request_id)] = exception
+            else:
+                responses[int(request_id)] = response
+
+        async def run_batch(start: int) -> None:
+            batch = self.service.new_batch_http_request(callback=callback)
+            for index in range(start, min(start + GMAIL_BATCH_SIZE, len(requests))):
+                batch.add(requests[index], request_id=str(index))
+
+            async with semaphore:
+                await asyncio.to_thread(batch.execute, http=self._http)
+
+        await asyncio.gather(
+            *(run_batch(start) for start in range(0, len(requests), GMAIL_BATCH_SIZE))
+        )
 
-    def _extract_message_parts(self, payload: Dict[str, Any]) -> MessagePart:
-        """Extract message parts from Gmail API payload.
+        # A malformed batch response can leave a request without a callback
+        for index, response in enumerate(responses):
+            if response is None:
+                error = RuntimeError(f"No response for batched request {index}")
+                errors.append(error)
+                responses[index] = error
+
+        if errors and not return_exceptions:
+            raise errors[0]
+
+        return responses
+
+    async def _execute_bulk(
+        self, requests: List["HttpRequest"]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Execute requests, using the batch endpoint only when there is more than one.
 
         Args:
-            payload: Gmail API message payload
+            requests: Prepared Gmail API requests
 
         Returns:
-            MessagePart object
+            Response or exception per request, in request order
         """
-        parts = []
-        if "parts" in payload:
-            for part in payload["parts"]:
-                parts.append(self._extract_message_parts(part))
-
-        return MessagePart(
-            part_id=payload.get("partId"),
-            mime_type=payload.get("mimeType", ""),
-            filename=payload.get("filename"),
-            headers=payload.get("headers", []),
-            body=payload.get("body", {}),
-            parts=parts if parts else None,
+        if len(requests) == 1:
+            try:
+                return [await asyncio.to_thread(requests[0].execute)]
+            except Exception as e:
+                return [e]
+        return await self._execute_batch(requests, return_exceptions=True)
+
+    async def _create_drafts(
+        self, bodies: List[Dict[str, Any]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Create drafts for a micro-batch of drafts.create request bodies."""
+        drafts = self.service.users().drafts()
+        return await self._execute_bulk([drafts.create(userId="me", body=body) for body in bodies])
+
+    async def _send_messages(
+        self, bodies: List[Dict[str, Any]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Send a micro-batch of messages.send request bodies."""
+        messages = self.service.users().messages()
+        return await self._execute_bulk([messages.send(userId="me", body=body) for body in bodies])
+
+    async def _modify_messages(
+        self, changes: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Apply a micro-batch of (message ID, messages.modify body) label changes."""
+        messages = self.service.users().messages()
+        return await self._execute_bulk(
+            [messages.modify(userId="me", id=message_id, body=body) for message_id, body in changes]
         )
 
+    def _parse_message_headers(
+        self, headers: List[Dict[str, str]], wanted: Optional[frozenset[str]] = None
+    ) -> Dict[str, str]:
+        """Parse message headers into a dictionary.
+
+        Args:
+            headers: List of header dictionaries
+            wanted: Lowercased header names to keep; stops scanning once all are found
+
+        Returns:
+            Dictionary of lowercased header name -> value
+        """
+        if wanted is None:
+            return {header["name"].lower(): header["value"] for header in headers}
+
+        found: Dict[str, str] = {}
+        for header in headers:
+            name = header["name"].lower()
+            if name in wanted and name not in found:
+                found[name] = header["value"]
+                if len(found) == len(wanted):
+                    break
+        return found
+
+    def _build_message_parts(
+        self, nodes: List[Dict[str, Any]], parents: List[int]
+    ) -> MessagePart:
+        """Build the MessagePart tree from a pre-order list of payload parts.
+
+        Args:
+            nodes: Payload parts in document (pre-)order, root first
+            parents: Index of each part's parent in nodes, -1 for the root
+
+        Returns:
+            Root MessagePart object
+        """
+        # Build bottom-up so every node's children exist before it does
+        children: List[List[MessagePart]] = [[] for _ in nodes]
+        message_part = None
+        for index in range(len(nodes) - 1, -1, -1):
+            part = nodes[index]
+            subparts = children[index]
+            subparts.reverse()
+            message_part = MessagePart(
+                part_id=part.get("partId"),
+                mime_type=part.get("mimeType", ""),
+                filename=part.get("filename"),
+                headers=part.get("headers", []),
+                body=part.get("body", {}),
+                parts=subparts if subparts else None,
+            )
+            if parents[index] >= 0:
+                children[parents[index]].append(message_part)
+
+        return message_part
+
     def _extract_message_content(
-        self, payload: Dict[str, Any]
-    ) -> tuple[str, str, List[AttachmentData]]:
-        """Extract text content and attachments from message payload.
+        self,
+        payload: Dict[str, Any],
+        include_parts: bool = False,
+        *,
+        want_text: bool = True,
+        want_html: bool = True,
+        want_attachments: bool = True,
+    ) -> tuple[str, str, List[AttachmentData], Optional[MessagePart]]:
+        """Extract text content, attachments and optionally the part tree from a payload.
 
         Args:
             payload: Gmail API message payload
+            include_parts: Also build the MessagePart tree in the same pass
+            want_text: Decode text/plain bodies
+            want_html: Decode text/html bodies
+            want_attachments: Collect attachment metadata
 
         Returns:
-            Tuple of (plain_text, html_text, attachments)
+            Tuple of (plain_text, html_text, attachments, message_part); unwanted
+            items are left empty
         """
-        plain_text = ""
-        html_text = ""
-        attachments = []
+        if not (want_text or want_html or want_attachments or include_parts):
+            return "", "", [], None
 
-        def extract_from_part(part: Dict[str, Any]):
-            nonlocal plain_text, html_text, attachments
+        plain_chunks: List[bytes] = []
+        html_chunks: List[bytes] = []
+        attachments = []
+        nodes: List[Dict[str, Any]] = []
+        parents: List[int] = []
 
+        stack = [(payload, -1)]
+        while stack:
+            part, parent = stack.pop()
             mime_type = part.get("mimeType", "")
             body = part.get("body", {})
 
             if mime_type == "text/plain" and "data" in body:
-                plain_text += base64.urlsafe_b64decode(body["data"]).decode("utf-8")
+                if want_text:
+                    plain_chunks.append(pybase64.urlsafe_b64decode(body["data"]))
             elif mime_type == "text/html" and "data" in body:
-                html_text += base64.urlsafe_b64decode(body["data"]).decode("utf-8")
-            elif part.get("filename") and "attachmentId" in body:
+                if want_html:
+                    html_chunks.append(pybase64.urlsafe_b64decode(body["data"]))
+            elif want_attachments and part.get("filename") and "attachmentId" in body:
+                # Values come straight from the API, so skip re-validating them
                 attachments.append(
-                    AttachmentData(attachment_id=body["attachmentId"], size=body.get("size", 0))
+                    AttachmentData.model_construct(
+                        attachment_id=body["attachmentId"], size=body.get("size", 0)
+                    )
                 )
 
-            # Recursively process parts
+            if include_parts:
+                parents.append(parent)
+                nodes.append(part)
+
+            # Push sub-parts reversed so they are visited in document order
             if "parts" in part:
-                for subpart in part["parts"]:
-                    extract_from_part(subpart)
+                index = len(nodes) - 1
+                stack.extend((subpart, index) for subpart in reversed(part["parts"]))
 
-        extract_from_part(payload)
-        return plain_text, html_text, attachments
+        plain_text = b"".join(plain_chunks).decode("utf-8")
+        html_text = b"".join(html_chunks).decode("utf-8")
+        message_part = self._build_message_parts(nodes, parents) if include_parts else None
+        return plain_text, html_text, attachments, message_part
 
-    def _parse_message(self, msg_data: Dict[str, Any], format: str = "full") -> Message:
-        """Parse Gmail API message data into Message object.
+    def _extract_plain_text(self, payload: Dict[str, Any]) -> str:
+        """Extract the first text/plain body from a payload.
+
+        Stops walking the part tree as soon as a plain text body is found.
 
         Args:
-            msg_data: Gmail API message data
-            format: Format level for parsing (minimal, compact, full, metadata, raw)
+            payload: Gmail API message payload
 
         Returns:
-            Message object with appropriate level of detail
+            Decoded plain text, or an empty string if the message has none
         """
-        payload = msg_data.get("payload", {})
-        headers = self._parse_message_headers(payload.get("headers", []))
+        stack = [payload]
+        while stack:
+            part = stack.pop()
+            body = part.get("body", {})
+            if part.get("mimeType") == "text/plain" and "data" in body:
+                return pybase64.urlsafe_b64decode(body["data"]).decode("utf-8")
+            if "parts" in part:
+                stack.extend(reversed(part["parts"]))
+        return ""
+
+    def _message_base_data(self, msg_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the fields every message format carries.
 
-        # Parse date
+        Args:
+            msg_data: Gmail API message data
+
+        Returns:
+            Message keyword arguments shared by all formats, including ``date``
+        """
         date = None
         if "internalDate" in msg_data:
-            timestamp = int(msg_data["internalDate"]) / 1000
-            date = datetime.fromtimestamp(timestamp)
+            date = _timestamp_to_datetime(int(msg_data["internalDate"]) // 1000)
 
-        # Base minimal data
-        base_data = {
+        return {
             "id": msg_data["id"],
             "thread_id": msg_data["threadId"],
             "label_ids": msg_data.get("labelIds", []),
@@ -156,58 +579,70 @@ class GmailService:
             "history_id": msg_data.get("historyId"),
             "internal_date": date,
             "size_estimate": msg_data.get("sizeEstimate"),
+            "date": date,
         }
 
-        if format == "minimal":
-            # Return minimal data only
-            return Message(
-                **base_data,
-                payload=None,
-                raw=None,
-                subject=None,
-                sender=None,
-                recipient=None,
-                date=date,
-                body_text=None,
-                body_html=None,
-                attachments=[],
-            )
+    def _parse_message_minimal(
+        self, msg_data: Dict[str, Any], include_payload: bool = True
+    ) -> Message:
+        """Parse message data for the minimal format: IDs, labels and date only."""
+        return Message(**self._message_base_data(msg_data))
 
-        elif format == "compact":
-            # Extract minimal content (text only, no attachments)
-            plain_text = ""
-            if payload:
-                plain_text, _, _ = self._extract_message_content(payload)
-
-            return Message(
-                **base_data,
-                payload=None,  # Don't include full payload for efficiency
-                raw=None,
-                subject=headers.get("subject"),
-                sender=headers.get("from"),
-                recipient=headers.get("to"),
-                date=date,
-                body_text=plain_text,
-                body_html=None,  # Skip HTML for efficiency
-                attachments=[],  # Skip attachments for efficiency
-            )
+    def _parse_message_compact(
+        self, msg_data: Dict[str, Any], include_payload: bool = True
+    ) -> Message:
+        """Parse message data for the compact format: minimal plus main headers and text."""
+        payload = msg_data.get("payload", {})
+        headers = self._parse_message_headers(payload.get("headers", []), MESSAGE_HEADERS)
+
+        return Message(
+            **self._message_base_data(msg_data),
+            subject=headers.get("subject"),
+            sender=headers.get("from"),
+            recipient=headers.get("to"),
+            cc=headers.get("cc"),
+            body_text=self._extract_plain_text(payload) if payload else "",
+        )
 
-        else:
-            # Full parsing for FULL, METADATA, RAW formats
-            plain_text, html_text, attachments = self._extract_message_content(payload)
-
-            return Message(
-                **base_data,
-                payload=self._extract_message_parts(payload),
-                raw=msg_data.get("raw"),
-                subject=headers.get("subject"),
-                sender=headers.get("from"),
-                recipient=headers.get("to"),
-                date=date,
-                body_text=plain_text,
-                body_html=html_text,
-                attachments=attachments,
-            )
+    def _parse_message_full(
+        self, msg_data: Dict[str, Any], include_payload: bool = True
+    ) -> Message:
+        """Parse message data for the full, metadata and raw formats."""
+        payload = msg_data.get("payload", {})
+        headers = self._parse_message_headers(payload.get("headers", []), MESSAGE_HEADERS)
+        plain_text, html_text, attachments, message_part = self._extract_message_content(
+            payload, include_parts=include_payload and bool(payload)
+        )
+
+        return Message(
+            **self._message_base_data(msg_data),
+            payload=message_part,
+            raw=msg_data.get("raw"),
+            subject=headers.get("subject"),
+            sender=headers.get("from"),
+            recipient=headers.get("to"),
+            cc=headers.get("cc"),
+            body_text=plain_text,
+            body_html=html_text,
+            attachments=attachments,
+        )
+
+    def _parse_message(
+        self, msg_data: Dict[str, Any], format: str = "full", include_payload: bool = True
+    ) -> Message:
+        """Parse Gmail API message data into Message object.
+
+        Args:
+            msg_data: Gmail API message data
+            format: Format level for parsing (minimal, compact, full, metadata, raw)
+            include_payload: Build the MessagePart tree for full/metadata/raw formats;
+                callers that never read ``payload`` can skip it
+
+        Returns:
+            Message object with appropriate level of detail
+        """
+        parser = self._parsers.get(format, self._parse_message_full)
+        return parser(msg_data, include_payload)
 
     async def get_profile(self) -> Profile:
         """Get Gmail profile information.
@@ -216,7 +651,7 @@ class GmailService:
             Profile object
         """
         try:
-            profile = self.service.users().getProfile(userId="me").execute()
+            profile = await asyncio.to_thread(self.service.users().getProfile(userId="me").execute)
             return Profile(
                 email_address=profile["emailAddress"],
                 messages_total=profile["messagesTotal"],
@@ -224,9 +659,19 @@ class GmailService:
                 history_id=profile["historyId"],
             )
         except Exception as e:
-            logger.error(f"Error getting profile: {e}")
+            logger.error("Error getting profile: %s", e)
             raise
 
+    async def get_email_address(self) -> str:
+        """Get the authenticated user's email address, fetching the profile only once.
+
+        Returns:
+            Email address of the mailbox owner
+        """
+        if not self._email_address:
+            self._email_address = (await self.get_profile()).email_address
+        return self._email_address
+
     def _build_date_query(
         self,
         after_date: Optional[str] = None,
@@ -265,6 +710,76 @@ class GmailService:
 
         return " ".join(date_parts)
 
+    def _message_list_params(
+        self, request: EmailListRequest | SearchEmailsRequest
+    ) -> Dict[str, Any]:
+        """Build messages.list query parameters from a list or search request.
+
+        Args:
+            request: Email list or search request
+
+        Returns:
+            Keyword arguments for messages().list()
+        """
+        query_params = {
+            "userId": "me",
+            "maxResults": request.max_results,
+            "includeSpamTrash": request.include_spam_trash,
+            "fields": MESSAGE_LIST_FIELDS,
+        }
+
+        # Build query string with date filters
+        query_parts = []
+        if request.query:
+            query_parts.append(request.query)
+
+        date_query = self._build_date_query(
+            after_date=request.after_date,
+            before_date=request.before_date,
+            newer_than=request.newer_than,
+            older_than=request.older_than,
+        )
+        if date_query:
+            query_parts.append(date_query)
+
+        if query_parts:
+            query_params["q"] = " ".join(query_parts)
+
+        if request.label_ids:
+            query_params["labelIds"] = request.label_ids
+        if request.page_token:
+            query_params["pageToken"] = request.page_token
+
+        return query_params
+
+    async def _fetch_message_list(
+        self, request: EmailListRequest | SearchEmailsRequest, format: str
+    ) -> tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """List messages and fetch each one in the requested format.
+
+        Args:
+            request: Email list or search request
+            format: Message format (minimal, compact, full, raw, metadata)
+
+        Returns:
+            Tuple of (messages.list result, Gmail API message data in list order)
+        """
+        query_params = self._message_list_params(request)
+        # Listing is a blocking round trip too, so it also runs off the event loop
+        result = await asyncio.to_thread(
+            self.service.users().messages().list(**query_params).execute
+        )
+
+        # Fetch message details with specified format in batched requests
+        get_params = _message_get_params(format)
+        full_msgs = await self._execute_batch(
+            [
+                self.service.users().messages().get(userId="me", id=msg["id"], **get_params)
+                for msg in result.get("messages", [])
+            ]
+        )
+        return result, full_msgs
+
     async def list_messages(
         self, request: EmailListRequest, format: str = "full"
     ) -> EmailListResponse:
@@ -278,64 +793,112 @@ class GmailService:
             EmailListResponse with messages
         """
         try:
-            query_params = {
-                "userId": "me",
-                "maxResults": request.max_results,
-                "includeSpamTrash": request.include_spam_trash,
-            }
+            result, full_msgs = await self._fetch_message_list(request, format)
 
-            # Build query string with date filters
-            query_parts = []
-            if request.query:
-                query_parts.append(request.query)
+            messages = [self._parse_message(full_msg, format) for full_msg in full_msgs]
+            for message in messages:
+                self._message_cache.set((message.id, str(format)), message)
 
-            date_query = self._build_date_query(
-                after_date=request.after_date,
-                before_date=request.before_date,
-                newer_than=request.newer_than,
-                older_than=request.older_than,
+            return EmailListResponse(
+                messages=messages,
+                next_page_token=result.get("nextPageToken"),
+                result_size_estimate=result.get("resultSizeEstimate"),
             )
-            if date_query:
-                query_parts.append(date_query)
+        except Exception as e:
+            logger.error("Error listing messages: %s", e)
+            raise
 
-            if query_parts:
-                query_params["q"] = " ".join(query_parts)
+    async def list_messages_columnar(
+        self, request: EmailListRequest | SearchEmailsRequest, format: str = "compact"
+    ) -> EmailListResponseColumnar:
+        """List or search messages into a column-per-field response.
 
-            if request.label_ids:
-                query_params["labelIds"] = request.label_ids
-            if request.page_token:
-                query_params["pageToken"] = request.page_token
+        Skips building a Message per row, which suits clients rendering a table
+        of minimal or compact results.
 
-            result = self.service.users().messages().list(**query_params).execute()
+        Args:
+            request: Email list or search request
+            format: Message format (minimal or compact)
 
-            messages = []
-            for msg in result.get("messages", []):
-                # Map our custom formats to Gmail API formats
-                gmail_api_format = format
-                if format == "compact":
-                    gmail_api_format = "full"  # Get headers but not full body data
-
-                # Get message details with specified format
-                full_msg = (
-                    self.service.users()
-                    .messages()
-                    .get(userId="me", id=msg["id"], format=gmail_api_format)
-                    .execute()
-                )
-                messages.append(self._parse_message(full_msg, format))
+        Returns:
+            EmailListResponseColumnar with one list per field
+        """
+        format = str(format)
+        if format not in ("minimal", "compact"):
+            raise ValueError(f"Columnar listing supports minimal and compact formats, not {format}")
 
-            return EmailListResponse(
-                messages=messages,
+        try:
+            result, full_msgs = await self._fetch_message_list(request, format)
+
+            compact = format == "compact"
+            ids, thread_ids, label_ids, snippets, dates = [], [], [], [], []
+            subjects, senders, recipients, body_texts = [], [], [], []
+            for msg_data in full_msgs:
+                ids.append(msg_data["id"])
+                thread_ids.append(msg_data["threadId"])
+                label_ids.append(msg_data.get("labelIds", []))
+                snippets.append(msg_data.get("snippet"))
+                date = None
+                if "internalDate" in msg_data:
+                    date = _timestamp_to_datetime(int(msg_data["internalDate"]) // 1000)
+                dates.append(date)
+
+                if compact:
+                    payload = msg_data.get("payload", {})
+                    headers = self._parse_message_headers(
+                        payload.get("headers", []), MESSAGE_HEADERS
+                    )
+                    subjects.append(headers.get("subject"))
+                    senders.append(headers.get("from"))
+                    recipients.append(headers.get("to"))
+                    body_texts.append(
+                        self._extract_plain_text(payload) if payload else ""
+                    )
+
+            return EmailListResponseColumnar(
+                ids=ids,
+                thread_ids=thread_ids,
+                label_ids=label_ids,
+                snippets=snippets,
+                dates=dates,
+                subjects=subjects if compact else None,
+                senders=senders if compact else None,
+                recipients=recipients if compact else None,
+                body_texts=body_texts if compact else None,
                 next_page_token=result.get("nextPageToken"),
                 result_size_estimate=result.get("resultSizeEstimate"),
             )
         except Exception as e:
-            logger.error(f"Error listing messages: {e}")
+            logger.error("Error listing messages: %s", e)
             raise
 
     async def get_message(self, message_id: str, format: str = "full") -> Message:
         """Get a specific message by ID.
 
+        Args:
+            message_id: Message ID
+            format: Message format (minimal, compact, full, raw, metadata)
+
+        Returns:
+            Message object
+        """
+        cache_key = (message_id, str(format))
+        cached = self._message_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Concurrent requests for the same message share one fetch
+        fetch = self._message_fetches.get(cache_key)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_message(message_id, format))
+            self._message_fetches[cache_key] = fetch
+            fetch.add_done_callback(lambda _: self._message_fetches.pop(cache_key, None))
+        # Shielded so one caller being cancelled does not fail the others
+        return await asyncio.shield(fetch)
+
+    async def _fetch_message(self, message_id: str, format: str) -> Message:
+        """Fetch and cache a message from the Gmail API.
+
         Args:
             message_id: Message ID
             format: Message format (minimal, compact, full, raw, metadata)
@@ -344,20 +907,117 @@ class GmailService:
             Message object
         """
         try:
-            # Map our custom formats to Gmail API formats
-            gmail_api_format = format
-            if format == "compact":
-                gmail_api_format = "full"  # Get headers but not full body data
+            msg_data = await asyncio.to_thread(
+                self.service.users()
+                .messages()
+                .get(userId="me", id=message_id, **_message_get_params(format))
+                .execute
+            )
+            message = self._parse_message(msg_data, format)
+            self._message_cache.set((message_id, str(format)), message)
+            return message
+        except Exception as e:
+            logger.error("Error getting message %s: %s", message_id, e)
+            raise
+
+    async def list_attachments(self, message_id: str) -> List[AttachmentData]:
+        """List a message's attachments without downloading its bodies.
 
-            msg_data = (
+        Args:
+            message_id: Message ID
+
+        Returns:
+            Attachment metadata (ID and size) in document order
+        """
+        cached = self._message_cache.get((message_id, MessageFormat.FULL.value))
+        if cached is not None:
+            return cached.attachments
+
+        try:
+            msg_data = await asyncio.to_thread(
                 self.service.users()
                 .messages()
-                .get(userId="me", id=message_id, format=gmail_api_format)
-                .execute()
+                .get(userId="me", id=message_id, format="full", fields=ATTACHMENT_FIELDS)
+                .execute
             )
-            return self._parse_message(msg_data, format)
+            _, _, attachments, _ = self._extract_message_content(
+                msg_data.get("payload", {}), want_text=False, want_html=False
+            )
+            return attachments
         except Exception as e:
-            logger.error(f"Error getting message {message_id}: {e}")
+            logger.error("Error listing attachments for message %s: %s", message_id, e)
+            raise
+
+    async def batch_get_messages(
+        self, message_ids: List[str], format: str = "full"
+    ) -> Tuple[Dict[str, Message], Dict[str, str]]:
+        """Get several messages by ID, fetching uncached ones in batched requests.
+
+        A message that fails in the batch is fetched again on its own, unless Gmail
+        reported it as not found. Messages that still fail are reported per ID, so one
+        stale ID does not lose the others.
+
+        Args:
+            message_ids: Message IDs
+            format: Message format (minimal, compact, full, raw, metadata)
+
+        Returns:
+            Tuple of (message ID -> Message in the order of message_ids,
+            message ID -> error for the messages that could not be fetched)
+        """
+        format = str(format)
+        messages: Dict[str, Optional[Message]] = {
+            message_id: self._message_cache.get((message_id, format))
+            for message_id in message_ids
+        }
+        missing = [message_id for message_id, message in messages.items() if message is None]
+        if not missing:
+            return messages, {}
+
+        try:
+            get_params = _message_get_params(format)
+            messages_api = self.service.users().messages()
+            results = await self._execute_batch(
+                [
+                    messages_api.get(userId="me", id=message_id, **get_params)
+                    for message_id in missing
+                ],
+                return_exceptions=True,
+            )
+            outcomes = dict(zip(missing, results))
+
+            retry = [
+                message_id
+                for message_id, result in outcomes.items()
+                if isinstance(result, Exception) and getattr(result, "status_code", None) != 404
+            ]
+            if retry:
+                logger.warning(
+                    "Batched get failed for %d messages; fetching them individually", len(retry)
+                )
+                retried = await asyncio.gather(
+                    *(
+                        asyncio.to_thread(
+                            messages_api.get(userId="me", id=message_id, **get_params).execute
+                        )
+                        for message_id in retry
+                    ),
+                    return_exceptions=True,
+                )
+                outcomes.update(zip(retry, retried))
+
+            errors: Dict[str, str] = {}
+            for message_id, result in outcomes.items():
+                if isinstance(result, Exception):
+                    del messages[message_id]
+                    errors[message_id] = _error_detail(result)
+                    continue
+                message = self._parse_message(result, format)
+                self._message_cache.set((message_id, format), message)
+                messages[message_id] = message
+            return messages, errors
+        except Exception as e:
+            logger.error("Error batch getting messages: %s", e)
             raise
 
     async def search_messages(
@@ -375,48 +1035,11 @@ class GmailService:
             EmailListResponse with matching messages
         """
         try:
-            # Build query string with date filters
-            query_parts = [request.query]
-
-            date_query = self._build_date_query(
-                after_date=request.after_date,
-                before_date=request.before_date,
-                newer_than=request.newer_than,
-                older_than=request.older_than,
-            )
-            if date_query:
-                query_parts.append(date_query)
-
-            final_query = " ".join(query_parts)
-
-            query_params = {
-                "userId": "me",
-                "q": final_query,
-                "maxResults": request.max_results,
-                "includeSpamTrash": request.include_spam_trash,
-            }
-
-            if request.label_ids:
-                query_params["labelIds"] = request.label_ids
-            if request.page_token:
-                query_params["pageToken"] = request.page_token
-
-            result = self.service.users().messages().list(**query_params).execute()
-
-            messages = []
-            for msg in result.get("messages", []):
-                # Map our custom formats to Gmail API formats
-                gmail_api_format = format.__str__()
-                if format == MessageFormat.COMPACT:
-                    gmail_api_format = "full"  # Get headers but not full body data
+            result, full_msgs = await self._fetch_message_list(request, format.__str__())
 
-                full_msg = (
-                    self.service.users()
-                    .messages()
-                    .get(userId="me", id=msg["id"], format=gmail_api_format)
-                    .execute()
-                )
-                messages.append(self._parse_message(full_msg, format.__str__()))
+            messages = [self._parse_message(full_msg, format.__str__()) for full_msg in full_msgs]
+            for message in messages:
+                self._message_cache.set((message.id, str(format)), message)
 
             return EmailListResponse(
                 messages=messages,
@@ -424,9 +1047,125 @@ class GmailService:
                 result_size_estimate=result.get("resultSizeEstimate"),
             )
         except Exception as e:
-            logger.error(f"Error searching messages: {e}")
+            logger.error("Error searching messages: %s", e)
             raise
 
+    def _create_mime_message(
+        self, body_text: Optional[str], body_html: Optional[str] = None
+    ) -> EmailMessage:
+        """Create a MIME message with a plain text and/or HTML body.
+
+        Args:
+            body_text: Plain text body
+            body_html: HTML body; sent as an alternative when body_text is set
+
+        Returns:
+            EmailMessage without headers set
+        """
+        msg = EmailMessage(policy=policy.SMTP)
+        if body_html and not body_text:
+            msg.set_content(body_html, subtype="html")
+        else:
+            msg.set_content(body_text or "")
+            if body_html:
+                msg.add_alternative(body_html, subtype="html")
+        return msg
+
+    def _to_addresses(self, addresses: List[str]) -> Tuple[Address, ...]:
+        """Convert recipient strings into Address objects for an address header.
+
+        Args:
+            addresses: Addresses, optionally with display names ("Name <addr>")
+
+        Returns:
+            Tuple of Address objects, one per address in the entries
+
+        Raises:
+            ValueError: If an entry is not a valid email address
+        """
+        parsed = []
+        for entry in addresses:
+            try:
+                pairs = getaddresses([entry])
+                entry_addresses = [
+                    Address(display_name=name, addr_spec=addr) for name, addr in pairs
+                ]
+            except (ValueError, HeaderParseError):
+                entry_addresses = []
+            if not entry_addresses or not all(address.domain for address in entry_addresses):
+                raise ValueError(f"Invalid email address: {entry!r}")
+            parsed.extend(entry_addresses)
+        return tuple(parsed)
+
+    async def reply_recipients(
+        self, message: Message, reply_all: bool = False
+    ) -> Tuple[List[str], List[str]]:
+        """Work out the To and CC recipients of a reply to a message.
+
+        For reply-all, the original To and CC addresses are parsed in one pass and
+        copied to CC, skipping the sender, the user's own address and duplicates.
+
+        Args:
+            message: Message being replied to, fetched with its headers
+            reply_all: Also address everyone the original was sent to
+
+        Returns:
+            Tuple of (to, cc) address lists
+        """
+        to = [message.sender] if message.sender else []
+        if not reply_all:
+            return to, []
+
+        seen = {(await self.get_email_address()).lower()}
+        seen.update(addr.lower() for _, addr in getaddresses(to))
+
+        cc = []
+        for name, addr in getaddresses([message.recipient or "", message.cc or ""]):
+            if addr and addr.lower() not in seen:
+                seen.add(addr.lower())
+                cc.append(formataddr((name, addr)))
+        return to, cc
+
+    def _attach_file(self, msg: EmailMessage, path: str) -> None:
+        """Attach a file to a message, converting it to multipart/mixed if needed.
+
+        The file is memory-mapped and base64-encoded straight from the mapping,
+        so its contents are never read into a separate Python bytes object.
+
+        Args:
+            msg: Message to attach the file to
+            path: Path of the file to attach
+        """
+        if msg.get_content_type() != "multipart/mixed":
+            msg.make_mixed()
+
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    encoded = pybase64.encodebytes(mapped)
+            else:
+                encoded = b""
+
+        part = type(msg)(policy=msg.policy)
+        part["Content-Type"] = "application/octet-stream"
+        part["Content-Transfer-Encoding"] = "base64"
+        part.add_header("Content-Disposition", "attachment", filename=os.path.basename(path))
+        part.set_payload(encoded.decode("ascii"))
+        msg.attach(part)
+
+    def _encode_message(self, msg: EmailMessage) -> str:
+        """Serialize a MIME message to the base64url form the Gmail API expects.
+
+        Args:
+            msg: Message to serialize
+
+        Returns:
+            Base64url encoded RFC 2822 message
+        """
+        buffer = BytesIO()
+        BytesGenerator(buffer, policy=policy.SMTP).flatten(msg)
+        return pybase64.urlsafe_b64encode(buffer.getvalue()).decode("ascii")
+
     async def send_message(self, request: SendEmailRequest) -> str:
         """Send an email message.
 
@@ -437,23 +1176,14 @@ class GmailService:
             Message ID of sent email
         """
         try:
-            # Create MIME message
-            if request.body_html:
-                msg = MIMEMultipart("alternative")
-                if request.body_text:
-                    text_part = MIMEText(request.body_text, "plain")
-                    msg.attach(text_part)
-                html_part = MIMEText(request.body_html, "html")
-                msg.attach(html_part)
-            else:
-                msg = MIMEText(request.body_text or "", "plain")
+            msg = self._create_mime_message(request.body_text, request.body_html)
 
             # Set headers
-            msg["To"] = ", ".join(request.to)
+            msg["To"] = self._to_addresses(request.to)
             if request.cc:
-                msg["Cc"] = ", ".join(request.cc)
+                msg["Cc"] = self._to_addresses(request.cc)
             if request.bcc:
-                msg["Bcc"] = ", ".join(request.bcc)
+                msg["Bcc"] = self._to_addresses(request.bcc)
             msg["Subject"] = request.subject
 
             if request.in_reply_to:
@@ -462,40 +1192,25 @@ class GmailService:
                 msg["References"] = request.thread_id
 
             # Handle attachments
-            if request.attachments:
-                if not isinstance(msg, MIMEMultipart):
-                    # Convert to multipart if we have attachments
-                    original_msg = msg
-                    msg = MIMEMultipart()
-                    msg.attach(original_msg)
-                    # Copy headers
-                    for key, value in original_msg.items():
-                        msg[key] = value
-
-                for attachment_path in request.attachments:
-                    if os.path.exists(attachment_path):
-                        with open(attachment_path, "rb") as f:
-                            attachment = MIMEBase("application", "octet-stream")
-                            attachment.set_payload(f.read())
-                            encoders.encode_base64(attachment)
-                            attachment.add_header(
-                                "Content-Disposition",
-                                f"attachment; filename= {os.path.basename(attachment_path)}",
-                            )
-                            msg.attach(attachment)
+            for attachment_path in request.attachments or []:
+                if os.path.exists(attachment_path):
+                    self._attach_file(msg, attachment_path)
 
             # Encode message
-            raw_message = base64.urlsafe_b64encode(msg.as_bytes()).decode("utf-8")
+            raw_message = self._encode_message(msg)
 
             send_request = {"raw": raw_message}
             if request.thread_id:
                 send_request["threadId"] = request.thread_id
 
-            result = self.service.users().messages().send(userId="me", body=send_request).execute()
+            result = await asyncio.to_thread(
+                self.service.users().messages().send(userId="me", body=send_request).execute
+            )
+            self._invalidate_listings()
 
             return result["id"]
         except Exception as e:
-            logger.error(f"Error sending message: {e}")
+            logger.error("Error sending message: %s", e)
             raise
 
     async def modify_message_labels(self, message_id: str, request: ModifyLabelsRequest) -> Message:
@@ -515,16 +1230,72 @@ class GmailService:
             if request.remove_label_ids:
                 modify_request["removeLabelIds"] = request.remove_label_ids
 
-            result = (
-                self.service.users()
-                .messages()
-                .modify(userId="me", id=message_id, body=modify_request)
-                .execute()
-            )
+            result = await self._modify_batcher.submit((message_id, modify_request))
+            self._invalidate_message(message_id)
 
-            return self._parse_message(result)
+            # Only labels are read from the modify response
+            return self._parse_message(result, include_payload=False)
         except Exception as e:
-            logger.error(f"Error modifying message labels: {e}")
+            logger.error("Error modifying message labels: %s", e)
+            raise
+
+    async def batch_modify_labels(
+        self, message_ids: List[str], request: ModifyLabelsRequest
+    ) -> List[str]:
+        """Modify labels on many messages with messages.batchModify.
+
+        batchModify fails as a whole if any ID is rejected, so a failed chunk is
+        retried as individual messages.modify calls, applying the change to every
+        message that accepts it.
+
+        Args:
+            message_ids: Message IDs to modify; sent in chunks of up to 1000
+            request: Label modification request applied to every message
+
+        Returns:
+            IDs of messages that could not be modified
+        """
+        try:
+            modify_request: Dict[str, Any] = {}
+            if request.add_label_ids:
+                modify_request["addLabelIds"] = request.add_label_ids
+            if request.remove_label_ids:
+                modify_request["removeLabelIds"] = request.remove_label_ids
+
+            messages = self.service.users().messages()
+            failed: List[str] = []
+            for start in range(0, len(message_ids), GMAIL_BATCH_MODIFY_LIMIT):
+                chunk = message_ids[start : start + GMAIL_BATCH_MODIFY_LIMIT]
+                try:
+                    await asyncio.to_thread(
+                        messages.batchModify(
+                            userId="me", body={"ids": chunk, **modify_request}
+                        ).execute
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "batchModify failed (%s); modifying %d messages individually",
+                        e,
+                        len(chunk),
+                    )
+                    # Individual modifies go out in batch requests, a bounded number at a time
+                    results = await self._execute_batch(
+                        [
+                            messages.modify(userId="me", id=message_id, body=modify_request)
+                            for message_id in chunk
+                        ],
+                        return_exceptions=True,
+                    )
+                    failed.extend(
+                        message_id
+                        for message_id, result in zip(chunk, results)
+                        if isinstance(result, Exception)
+                    )
+                for message_id in chunk:
+                    self._invalidate_message(message_id)
+            return failed
+        except Exception as e:
+            logger.error("Error batch modifying message labels: %s", e)
             raise
 
     async def delete_message(self, message_id: str) -> bool:
@@ -537,10 +1308,13 @@ class GmailService:
             True if successful
         """
         try:
-            self.service.users().messages().delete(userId="me", id=message_id).execute()
+            await asyncio.to_thread(
+                self.service.users().messages().delete(userId="me", id=message_id).execute
+            )
+            self._invalidate_message(message_id)
             return True
         except Exception as e:
-            logger.error(f"Error deleting message: {e}")
+            logger.error("Error deleting message: %s", e)
             raise
 
     async def list_labels(self) -> LabelListResponse:
@@ -550,37 +1324,66 @@ class GmailService:
             LabelListResponse with labels
         """
         try:
-            result = self.service.users().labels().list(userId="me").execute()
+            result = await asyncio.to_thread(
+                self.service.users().labels().list(userId="me").execute
+            )
 
             labels = []
+            label_cache = {}
             for label_data in result.get("labels", []):
-                label = Label(
-                    id=label_data["id"],
-                    name=label_data["name"],
-                    type=label_data["type"].lower(),
-                    message_list_visibility=label_data.get("messageListVisibility"),
-                    label_list_visibility=label_data.get("labelListVisibility"),
-                    messages_total=label_data.get("messagesTotal"),
-                    messages_unread=label_data.get("messagesUnread"),
-                    threads_total=label_data.get("threadsTotal"),
-                    threads_unread=label_data.get("threadsUnread"),
+                label_id = label_data["id"]
+                signature = (
+                    label_data["name"],
+                    label_data["type"],
+                    label_data.get("messageListVisibility"),
+                    label_data.get("labelListVisibility"),
+                    label_data.get("messagesTotal"),
+                    label_data.get("messagesUnread"),
+                    label_data.get("threadsTotal"),
+                    label_data.get("threadsUnread"),
                 )
+                cached = self._label_cache.get(label_id)
+                if cached is not None and cached[0] == signature:
+                    label = cached[1]
+                else:
+                    label = Label(
+                        id=label_id,
+                        name=label_data["name"],
+                        type=label_data["type"].lower(),
+                        message_list_visibility=label_data.get("messageListVisibility"),
+                        label_list_visibility=label_data.get("labelListVisibility"),
+                        messages_total=label_data.get("messagesTotal"),
+                        messages_unread=label_data.get("messagesUnread"),
+                        threads_total=label_data.get("threadsTotal"),
+                        threads_unread=label_data.get("threadsUnread"),
+                    )
+                label_cache[label_id] = (signature, label)
                 labels.append(label)
 
+            self._label_cache = label_cache
+            self._labels_by_name = {label.name: label for label in labels}
+
             return LabelListResponse(labels=labels)
         except Exception as e:
-            logger.error(f"Error listing labels: {e}")
+            logger.error("Error listing labels: %s", e)
             raise
 
     async def create_label(self, request: CreateLabelRequest) -> Label:
         """Create a new label.
 
+        A label this service created recently is returned as is when its name is
+        requested again, so a retried call does not fail on the existing label.
+
         Args:
             request: Create label request
 
         Returns:
             Created Label object
         """
+        created = self._created_labels.get(request.name)
+        if created is not None:
+            return created
+
         try:
             label_object = {
                 "name": request.name,
@@ -588,78 +1391,84 @@ class GmailService:
                 "labelListVisibility": request.label_list_visibility,
             }
 
-            result = self.service.users().labels().create(userId="me", body=label_object).execute()
+            result = await asyncio.to_thread(
+                self.service.users().labels().create(userId="me", body=label_object).execute
+            )
 
-            return Label(
+            label = Label(
                 id=result["id"],
                 name=result["name"],
                 type="user",
                 message_list_visibility=result.get("messageListVisibility"),
                 label_list_visibility=result.get("labelListVisibility"),
             )
+            self._labels_by_name[label.name] = label
+            self._created_labels.set(request.name, label)
+            self.response_cache.clear()
+            return label
         except Exception as e:
-            logger.error(f"Error creating label: {e}")
+            logger.error("Error creating label: %s", e)
             raise
 
-    async def forward_message(self, message_id: str, request: ForwardEmailRequest) -> str:
+    async def get_label_by_name(self, name: str) -> Optional[Label]:
+        """Resolve a label by name, listing labels only on a cache miss.
+
+        Args:
+            name: Label name (system labels use their ID, e.g. INBOX)
+
+        Returns:
+            Matching Label, or None if no label has that name
+        """
+        label = self._labels_by_name.get(name)
+        if label is None:
+            await self.list_labels()
+            label = self._labels_by_name.get(name)
+        return label
+
+    async def forward_message(
+        self,
+        message_id: str,
+        request: ForwardEmailRequest,
+        prefetched: Optional[Message] = None,
+    ) -> str:
         """Forward an email message.
 
         Args:
             message_id: ID of message to forward
             request: Forward email request
+            prefetched: Original message in full format, if the caller already has it
 
         Returns:
             Message ID of forwarded email
         """
         try:
-            # Get original message
-            original_message = await self.get_message(message_id)
+            # Get original message; get_message serves repeat lookups from the cache
+            original_message = prefetched or await self.get_message(message_id)
 
             # Create forwarded message
-            if original_message.body_html:
-                msg = MIMEMultipart("alternative")
-
-                # Add additional message if provided
-                forward_content = ""
-                if request.additional_message:
-                    forward_content = f"{request.additional_message}\n\n"
-
-                forward_content += f"---------- Forwarded message ---------\n"
-                forward_content += f"From: {original_message.sender}\n"
-                forward_content += f"Date: {original_message.date}\n"
-                forward_content += f"Subject: {original_message.subject}\n"
-                forward_content += f"To: {original_message.recipient}\n\n"
-
-                # Text part
-                text_part = MIMEText(forward_content + (original_message.body_text or ""), "plain")
-                msg.attach(text_part)
-
-                # HTML part
-                html_content = forward_content.replace("\n", "<br>") + (
-                    original_message.body_html or ""
-                )
-                html_part = MIMEText(html_content, "html")
-                msg.attach(html_part)
-            else:
-                forward_content = ""
-                if request.additional_message:
-                    forward_content = f"{request.additional_message}\n\n"
+            forward_content = ""
+            if request.additional_message:
+                forward_content = f"{request.additional_message}\n\n"
 
-                forward_content += f"---------- Forwarded message ---------\n"
-                forward_content += f"From: {original_message.sender}\n"
-                forward_content += f"Date: {original_message.date}\n"
-                forward_content += f"Subject: {original_message.subject}\n"
-                forward_content += f"To: {original_message.recipient}\n\n"
-                forward_content += original_message.body_text or ""
+            forward_content += f"---------- Forwarded message ---------\n"
+            forward_content += f"From: {original_message.sender}\n"
+            forward_content += f"Date: {original_message.date}\n"
+            forward_content += f"Subject: {original_message.subject}\n"
+            forward_content += f"To: {original_message.recipient}\n\n"
 
-                msg = MIMEText(forward_content, "plain")
+            html_content = None
+            if original_message.body_html:
+                html_content = forward_content.replace("\n", "<br>") + original_message.body_html
+            msg = self._create_mime_message(
+                forward_content + (original_message.body_text or ""), html_content
+            )
 
             # Set headers
-            msg["To"] = ", ".join(request.to)
+            msg["To"] = self._to_addresses(request.to)
             if request.cc:
-                msg["Cc"] = ", ".join(request.cc)
+                msg["Cc"] = self._to_addresses(request.cc)
             if request.bcc:
-                msg["Bcc"] = ", ".join(request.bcc)
+                msg["Bcc"] = self._to_addresses(request.bcc)
 
             subject = original_message.subject or ""
             if not subject.startswith("Fwd:"):
@@ -667,23 +1476,72 @@ class GmailService:
             msg["Subject"] = subject
 
             # Encode and send
-            raw_message = base64.urlsafe_b64encode(msg.as_bytes()).decode("utf-8")
+            raw_message = self._encode_message(msg)
 
-            result = (
-                self.service.users()
-                .messages()
-                .send(userId="me", body={"raw": raw_message})
-                .execute()
-            )
+            result = await self._send_batcher.submit({"raw": raw_message})
+            self._invalidate_listings()
 
             return result["id"]
         except Exception as e:
-            logger.error(f"Error forwarding message: {e}")
+            logger.error("Error forwarding message: %s", e)
             raise
 
+    async def _with_prefetch(
+        self,
+        kind: str,
+        request: Union[ThreadListRequest, DraftListRequest],
+        fetch: Callable[[Any], Awaitable[Any]],
+    ) -> Any:
+        """Serve a listing page, then start fetching the page after it.
+
+        Callers paging through results usually ask for the next page right away, so it
+        is fetched while the current one is being serialized and returned.
+
+        Args:
+            kind: Listing name, part of the prefetch key
+            request: Thread or draft list request
+            fetch: Coroutine function fetching one page for a request
+
+        Returns:
+            The page for request, with next_page_token set if there are more
+        """
+        response = None
+        key = (kind, request.model_dump_json())
+        task = self._prefetched.get(key)
+        if task is not None:
+            self._prefetched.pop(key)
+            try:
+                response = await task
+            except Exception:
+                # A failed prefetch is retried below, where errors reach the caller
+                response = None
+
+        if response is None:
+            response = await fetch(request)
+
+        if response.next_page_token:
+            next_request = request.model_copy(update={"page_token": response.next_page_token})
+            task = asyncio.create_task(fetch(next_request))
+            # Nobody may await a prefetch, so retrieve its exception to avoid a warning
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._prefetched.set((kind, next_request.model_dump_json()), task)
+
+        return response
+
     async def list_threads(self, request: ThreadListRequest) -> ThreadListResponse:
         """List email threads.
 
+        Args:
+            request: Thread list request
+
+        Returns:
+            ThreadListResponse with threads
+        """
+        return await self._with_prefetch("threads", request, self._fetch_threads)
+
+    async def _fetch_threads(self, request: ThreadListRequest) -> ThreadListResponse:
+        """Fetch one page of email threads.
+
         Args:
             request: Thread list request
 
@@ -710,6 +1568,7 @@ class GmailService:
                 "userId": "me",
                 "maxResults": request.max_results,
                 "includeSpamTrash": request.include_spam_trash,
+                "fields": THREAD_LIST_FIELDS,
             }
 
             if request.label_ids:
@@ -719,22 +1578,64 @@ class GmailService:
             if request.page_token:
                 query_params["pageToken"] = request.page_token
 
-            result = self.service.users().threads().list(**query_params).execute()
+            list_key = (
+                tuple(request.label_ids or ()),
+                final_query,
+                request.max_results,
+                request.include_spam_trash,
+                request.page_token,
+            )
+            result = self._thread_list_cache.get(list_key)
+            if result is None:
+                # Runs off the event loop so a prefetch task does not block other requests
+                result = await asyncio.to_thread(
+                    self.service.users().threads().list(**query_params).execute
+                )
+                self._thread_list_cache.set(list_key, result)
 
             gmail_api_format = request.message_format.__str__()
+            get_params: Dict[str, Any] = {}
             if gmail_api_format == "compact":
-                gmail_api_format = "full"
-
-            threads = []
-            for thread_data in result.get("threads", []):
-                # Get full thread details
-                full_thread = (
+                if request.expand_bodies:
+                    gmail_api_format = "full"
+                else:
+                    # Summaries only need headers; full threads can be hundreds of KB
+                    gmail_api_format = "metadata"
+                    get_params["metadataHeaders"] = THREAD_METADATA_HEADERS
+
+            # Reuse threads whose history ID is unchanged since they were last parsed
+            thread_keys = [
+                (
+                    thread_data["id"],
+                    thread_data["historyId"],
+                    gmail_api_format,
+                    str(request.message_format),
+                )
+                if thread_data.get("historyId")
+                else None
+                for thread_data in result.get("threads", [])
+            ]
+            threads: List[Optional[Thread]] = [
+                self._thread_cache.get(key) if key is not None else None for key in thread_keys
+            ]
+            missing = [index for index, thread in enumerate(threads) if thread is None]
+
+            # Get details of the remaining threads in batched requests
+            full_threads = await self._execute_batch(
+                [
                     self.service.users()
                     .threads()
-                    .get(userId="me", id=thread_data["id"], format=gmail_api_format)
-                    .execute()
-                )
+                    .get(
+                        userId="me",
+                        id=result["threads"][index]["id"],
+                        format=gmail_api_format,
+                        **get_params,
+                    )
+                    for index in missing
+                ]
+            )
 
+            for index, full_thread in zip(missing, full_threads):
                 messages = []
                 for msg_data in full_thread.get("messages", []):
                     messages.append(self._parse_message(msg_data, request.message_format.__str__()))
@@ -745,7 +1646,9 @@ class GmailService:
                     history_id=full_thread.get("historyId"),
                     messages=messages,
                 )
-                threads.append(thread)
+                threads[index] = thread
+                if thread_keys[index] is not None:
+                    self._thread_cache.set(thread_keys[index], thread)
 
             return ThreadListResponse(
                 threads=threads,
@@ -753,7 +1656,7 @@ class GmailService:
                 result_size_estimate=result.get("resultSizeEstimate"),
             )
         except Exception as e:
-            logger.error(f"Error listing threads: {e}")
+            logger.error("Error listing threads: %s", e)
             raise
 
     async def get_thread(
@@ -776,11 +1679,11 @@ class GmailService:
             if gmail_api_format == MessageFormat.COMPACT.__str__():
                 gmail_api_format = "full"
             # Get full thread details
-            full_thread = (
+            full_thread = await asyncio.to_thread(
                 self.service.users()
                 .threads()
                 .get(userId="me", id=thread_id, format=gmail_api_format)
-                .execute()
+                .execute
             )
 
             # Parse messages
@@ -798,7 +1701,7 @@ class GmailService:
 
             return thread
         except Exception as e:
-            logger.error(f"Error getting thread {thread_id}: {e}")
+            logger.error("Error getting thread %s: %s", thread_id, e)
             raise
 
     async def create_draft(self, request: CreateDraftRequest) -> str:
@@ -811,23 +1714,14 @@ class GmailService:
             Draft ID
         """
         try:
-            # Create MIME message
-            if request.body_html:
-                msg = MIMEMultipart("alternative")
-                if request.body_text:
-                    text_part = MIMEText(request.body_text, "plain")
-                    msg.attach(text_part)
-                html_part = MIMEText(request.body_html, "html")
-                msg.attach(html_part)
-            else:
-                msg = MIMEText(request.body_text or "", "plain")
+            msg = self._create_mime_message(request.body_text, request.body_html)
 
             # Set headers
-            msg["To"] = ", ".join(request.to)
+            msg["To"] = self._to_addresses(request.to)
             if request.cc:
-                msg["Cc"] = ", ".join(request.cc)
+                msg["Cc"] = self._to_addresses(request.cc)
             if request.bcc:
-                msg["Bcc"] = ", ".join(request.bcc)
+                msg["Bcc"] = self._to_addresses(request.bcc)
             msg["Subject"] = request.subject
 
             if request.in_reply_to:
@@ -836,17 +1730,18 @@ class GmailService:
                 msg["References"] = request.thread_id
 
             # Encode message
-            raw_message = base64.urlsafe_b64encode(msg.as_bytes()).decode("utf-8")
+            raw_message = self._encode_message(msg)
 
             draft_request = {"message": {"raw": raw_message}}
             if request.thread_id:
                 draft_request["message"]["threadId"] = request.thread_id
 
-            result = self.service.users().drafts().create(userId="me", body=draft_request).execute()
+            result = await self._draft_batcher.submit(draft_request)
+            self._invalidate_listings()
 
             return result["id"]
         except Exception as e:
-            logger.error(f"Error creating draft: {e}")
+            logger.error("Error creating draft: %s", e)
             raise
 
     async def list_drafts(
@@ -858,6 +1753,28 @@ class GmailService:
     ) -> DraftListResponse:
         """List draft emails.
 
+        Args:
+            request: Draft list request (preferred)
+            max_results: Maximum number of drafts to return (legacy)
+            page_token: Page token for pagination (legacy)
+            format: Message format (legacy)
+
+        Returns:
+            DraftListResponse with drafts
+        """
+        if request is None:
+            return await self._fetch_drafts(None, max_results, page_token, format)
+        return await self._with_prefetch("drafts", request, self._fetch_drafts)
+
+    async def _fetch_drafts(
+        self,
+        request: Optional[DraftListRequest] = None,
+        max_results: int = 10,
+        page_token: Optional[str] = None,
+        format: MessageFormat = MessageFormat.COMPACT,
+    ) -> DraftListResponse:
+        """Fetch one page of draft emails.
+
         Args:
             request: Draft list request (preferred)
             max_results: Maximum number of drafts to return (legacy)
@@ -881,27 +1798,36 @@ class GmailService:
                 after_date = None
                 before_date = None
 
-            query_params = {"userId": "me", "maxResults": max_results}
+            query_params = {
+                "userId": "me",
+                "maxResults": max_results,
+                "fields": DRAFT_LIST_FIELDS,
+            }
 
             if page_token:
                 query_params["pageToken"] = page_token
 
-            result = self.service.users().drafts().list(**query_params).execute()
+            # Runs off the event loop so a prefetch task does not block other requests
+            result = await asyncio.to_thread(
+                self.service.users().drafts().list(**query_params).execute
+            )
 
             gmail_api_format = format.__str__()
             if gmail_api_format == MessageFormat.COMPACT:
                 gmail_api_format = MessageFormat.FULL.__str__()
 
-            drafts = []
-            for draft_data in result.get("drafts", []):
-                # Get full draft details
-                full_draft = (
+            # Get full draft details in batched requests
+            full_drafts = await self._execute_batch(
+                [
                     self.service.users()
                     .drafts()
                     .get(userId="me", id=draft_data["id"], format=gmail_api_format)
-                    .execute()
-                )
+                    for draft_data in result.get("drafts", [])
+                ]
+            )
 
+            drafts = []
+            for full_draft in full_drafts:
                 message = self._parse_message(full_draft["message"], format.__str__())
 
                 # Apply date filtering if specified (since Gmail drafts API doesn't support search queries)
@@ -945,7 +1871,7 @@ class GmailService:
                 result_size_estimate=result.get("resultSizeEstimate"),
             )
         except Exception as e:
-            logger.error(f"Error listing drafts: {e}")
+            logger.error("Error listing drafts: %s", e)
             raise
 
     async def get_draft(
@@ -966,11 +1892,11 @@ class GmailService:
                 gmail_api_format = MessageFormat.FULL.__str__()
 
             # Get full draft details
-            full_draft = (
+            full_draft = await asyncio.to_thread(
                 self.service.users()
                 .drafts()
                 .get(userId="me", id=draft_id, format=gmail_api_format)
-                .execute()
+                .execute
             )
 
             message = self._parse_message(full_draft["message"], format.__str__())
@@ -978,7 +1904,7 @@ class GmailService:
 
             return draft
         except Exception as e:
-            logger.error(f"Error getting draft {draft_id}: {e}")
+            logger.error("Error getting draft %s: %s", draft_id, e)
             raise
 
     async def send_draft(self, draft_id: str) -> str:
@@ -991,13 +1917,14 @@ class GmailService:
             Message ID of sent email
         """
         try:
-            result = (
-                self.service.users().drafts().send(userId="me", body={"id": draft_id}).execute()
+            result = await asyncio.to_thread(
+                self.service.users().drafts().send(userId="me", body={"id": draft_id}).execute
             )
+            self._invalidate_listings()
 
             return result["id"]
         except Exception as e:
-            logger.error(f"Error sending draft: {e}")
+            logger.error("Error sending draft: %s", e)
             raise
 
     async def get_attachment(self, message_id: str, attachment_id: str) -> AttachmentData:
@@ -1010,20 +1937,27 @@ class GmailService:
         Returns:
             AttachmentData with downloaded content
         """
+        cache_key = (self._attachment_owner, message_id, attachment_id)
+        cached = _attachment_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            attachment = (
+            attachment = await asyncio.to_thread(
                 self.service.users()
                 .messages()
                 .attachments()
                 .get(userId="me", messageId=message_id, id=attachment_id)
-                .execute()
+                .execute
             )
 
-            return AttachmentData(
+            attachment_data = AttachmentData(
                 attachment_id=attachment_id,
                 size=attachment.get("size", 0),
                 data=attachment.get("data"),
             )
+            _attachment_cache.set(cache_key, attachment_data)
+            return attachment_data
         except Exception as e:
-            logger.error(f"Error getting attachment: {e}")
+            logger.error("Error getting attachment: %s", e)
             raise
@@ -0,0 +1,81 @@
+"""httplib2-compatible HTTP transport backed by httpx."""
+
+from typing import Dict, Optional, Tuple, Union
+
+import httplib2
+import httpx
+
+# Connection limits for the Gmail API client shared by all pooled services
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 50
+
+
+class HttpxTransport:
+    """Stand-in for httplib2.Http that sends googleapiclient requests through httpx.
+
+    googleapiclient only needs ``request()`` and ``close()``. Unlike httplib2.Http,
+    the underlying httpx.Client is thread-safe, so one transport can serve batch
+    requests running in worker threads, and with HTTP/2 they share a single
+    multiplexed connection. httpx falls back to HTTP/1.1 if the server does not
+    negotiate HTTP/2.
+    """
+
+    def __init__(
+        self, timeout: float, connect_timeout: Optional[float] = None, http2: bool = True
+    ):
+        """Initialize the transport.
+
+        Args:
+            timeout: Timeout in seconds for reading, writing and acquiring a connection
+            connect_timeout: Timeout in seconds for connecting; defaults to timeout
+            http2: Negotiate HTTP/2 when the server supports it
+        """
+        self._client = httpx.Client(
+            http2=http2,
+            timeout=httpx.Timeout(timeout, connect=connect_timeout or timeout),
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: Optional[Union[str, bytes]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        redirections: int = httplib2.DEFAULT_MAX_REDIRECTS,
+        connection_type: Optional[type] = None,
+    ) -> Tuple[httplib2.Response, bytes]:
+        """Send a request with the same signature and return shape as httplib2.Http.
+
+        Args:
+            uri: Request URL
+            method: HTTP method
+            body: Request body
+            headers: Request headers
+            redirections: Redirects to follow; 0 disables following
+            connection_type: Ignored, accepted for httplib2 compatibility
+
+        Returns:
+            Tuple of (httplib2.Response, response body)
+        """
+        response = self._client.request(
+            method, uri, content=body, headers=headers, follow_redirects=redirections > 0
+        )
+
+        info = {"status": str(response.status_code)}
+        for name, value in response.headers.multi_items():
+            info[name] = f"{info[name]}, {value}" if name in info else value
+        # httpx has already decoded the body, so the encoding headers no longer apply
+        info.pop("content-encoding", None)
+        info.pop("content-length", None)
+
+        resp = httplib2.Response(info)
+        resp.reason = response.reason_phrase
+        return resp, response.content
+
+    def close(self) -> None:
+        """Close the underlying connections."""
+        self._client.close()
@@ -1,19 +1,104 @@
-from typing import Optional, List
-import json
+from typing import Hashable, Optional, List
+import asyncio
 import logging
 
+import orjson
 from mcp.server import FastMCP
 from fastapi import HTTPException
 from mcp.server.fastmcp.server import Context
+from pydantic import BaseModel
 
 from ..services import GmailService
-from ..models import ForwardEmailRequest, CreateDraftRequest, MessageFormat, ThreadListRequest
-from ..dependencies import get_access_token, get_gmail_service
+from ..models import (
+    ForwardEmailRequest,
+    CreateDraftRequest,
+    DraftListRequest,
+    MessageFormat,
+    ModifyLabelsRequest,
+    ThreadListRequest,
+)
+from ..dependencies import get_context_gmail_service
+from ..core.cache import TTLCache
+from ..core.errors import log_tool_error
+from ..core.serialization import dumps, model_fragment, render
 
 
 logger = logging.getLogger(__name__)
 
 
+# Above this many uncached items, serialization runs in the default thread pool
+OFFLOAD_MIN_ITEMS = 32
+
+
+async def _dump_all(
+    cache: TTLCache[orjson.Fragment], items: List[BaseModel], keys: List[Optional[Hashable]]
+) -> List[orjson.Fragment]:
+    """Serialize models to JSON fragments, reusing cached bytes where available.
+
+    Cache lookups and stores stay on the event loop; only the serialization of
+    misses moves to a worker thread, and only for large pages where it would
+    otherwise stall other requests.
+
+    Args:
+        cache: Fragment cache of the caller's GmailService, so users never share entries
+        items: Models to serialize
+        keys: Cache key per item identifying its exact version, or None to skip caching
+
+    Returns:
+        One fragment per item, in order
+    """
+    fragments = [cache.get(key) if key is not None else None for key in keys]
+    missing = [i for i, fragment in enumerate(fragments) if fragment is None]
+
+    def dump_missing() -> List[orjson.Fragment]:
+        return [model_fragment(items[i]) for i in missing]
+
+    if len(missing) > OFFLOAD_MIN_ITEMS:
+        dumped = await asyncio.to_thread(dump_missing)
+    else:
+        dumped = dump_missing()
+
+    for i, fragment in zip(missing, dumped):
+        fragments[i] = fragment
+        if keys[i] is not None:
+            cache.set(keys[i], fragment)
+    return fragments
+
+
+# Recipients named in user-facing status messages before summarizing the rest
+DISPLAY_RECIPIENTS = 5
+
+
+def _format_recipients(recipients: List[str]) -> str:
+    """Format recipients for a status message, naming at most DISPLAY_RECIPIENTS.
+
+    Args:
+        recipients: Recipient addresses
+
+    Returns:
+        Comma-separated recipients, with a "(+N more)" suffix when truncated
+    """
+    shown = ", ".join(recipients[:DISPLAY_RECIPIENTS])
+    if len(recipients) > DISPLAY_RECIPIENTS:
+        return f"{shown} (+{len(recipients) - DISPLAY_RECIPIENTS} more)"
+    return shown
+
+
+# Pre-serialized success envelopes for the small fixed-shape responses; fields are
+# spliced in as already-encoded JSON values by render
+_FORWARD_TEMPLATE = (
+    '{{"success":true,"forwarded_message_id":{forwarded_message_id},'
+    '"original_message_id":{original_message_id},"message":{message}}}'
+)
+_MOVE_TEMPLATE = (
+    '{{"success":true,"message_id":{message_id},"moved_to":{moved_to},'
+    '"current_labels":{current_labels},"message":{message}}}'
+)
+_SEND_DRAFT_TEMPLATE = (
+    '{{"success":true,"message_id":{message_id},"draft_id":{draft_id},"message":{message}}}'
+)
+
+
 def register_advanced_tools(mcp: FastMCP):
     """Register advanced Gmail tools with MCP server.
 
@@ -43,12 +128,10 @@ def register_advanced_tools(mcp: FastMCP):
         Returns:
             JSON string with forward status and message ID
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = get_context_gmail_service(ctx)
         try:
-            # Forward the email using the Gmail service
-
-            request = ForwardEmailRequest(
+            # Arguments were validated against the tool signature; skip re-validating
+            request = ForwardEmailRequest.model_construct(
                 to=to,
                 cc=cc,
                 bcc=bcc,
@@ -57,18 +140,16 @@ def register_advanced_tools(mcp: FastMCP):
 
             forwarded_message_id = await gmail_service.forward_message(message_id, request)
 
-            result = {
-                "success": True,
-                "forwarded_message_id": forwarded_message_id,
-                "original_message_id": message_id,
-                "message": f"Email forwarded successfully to {', '.join(to)}",
-            }
-
-            return json.dumps(result, indent=2)
+            return render(
+                _FORWARD_TEMPLATE,
+                forwarded_message_id=forwarded_message_id,
+                original_message_id=message_id,
+                message=f"Email forwarded successfully to {_format_recipients(to)}",
+            )
 
         except Exception as e:
-            logger.error(f"Error in forward_email: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            log_tool_error(logger, "forward_email", e)
+            return dumps({"error": str(e), "success": False})
 
     @mcp.tool()
     async def gmail_move_to_folder(
@@ -88,40 +169,35 @@ def register_advanced_tools(mcp: FastMCP):
         Returns:
             JSON string with move status
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = get_context_gmail_service(ctx)
         try:
-
-            from ..models import ModifyLabelsRequest
-
             add_labels = [folder_label_id]
             remove_labels = []
 
-            if remove_inbox and folder_label_id not in ["INBOX"]:
+            if remove_inbox and folder_label_id != "INBOX":
                 remove_labels.append("INBOX")
 
-            request = ModifyLabelsRequest(
+            request = ModifyLabelsRequest.model_construct(
                 add_label_ids=add_labels,
                 remove_label_ids=remove_labels if remove_labels else None,
             )
 
             updated_message = await gmail_service.modify_message_labels(message_id, request)
 
-            result = {
-                "success": True,
-                "message_id": message_id,
-                "moved_to": folder_label_id,
-                "current_labels": updated_message.label_ids,
-                "message": f"Email moved to {folder_label_id}",
-            }
-
-            return json.dumps(result, indent=2)
+            return render(
+                _MOVE_TEMPLATE,
+                message_id=message_id,
+                moved_to=folder_label_id,
+                current_labels=updated_message.label_ids,
+                message=f"Email moved to {folder_label_id}",
+            )
 
         except Exception as e:
-            logger.error(f"Error in move_to_folder: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            log_tool_error(logger, "move_to_folder", e)
+            return dumps({"error": str(e), "success": False})
 
-    @mcp.tool()
+    # The JSON string is the whole result; structured output would send it twice
+    @mcp.tool(structured_output=False)
     async def gmail_get_threads(
         ctx: Context,
         max_results: int = 10,
@@ -131,6 +207,7 @@ def register_advanced_tools(mcp: FastMCP):
         page_token: Optional[str] = None,
         after: Optional[str] = None,
         before: Optional[str] = None,
+        expand_bodies: bool = False,
     ) -> str:
         """Get email threads/conversations.
 
@@ -142,13 +219,13 @@ def register_advanced_tools(mcp: FastMCP):
             page_token: Token for pagination
             after: Show threads after this date (YYYY/MM/DD format)
             before: Show threads before this date (YYYY/MM/DD format)
+            expand_bodies: Include message bodies (slower; headers only by default)
             ctx: MCP context for logging and progress
 
         Returns:
             JSON string with threads list
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = get_context_gmail_service(ctx)
         try:
             # GmailService is injected via dependency injection
 
@@ -160,22 +237,40 @@ def register_advanced_tools(mcp: FastMCP):
                 page_token=page_token,
                 after=after,
                 before=before,
+                expand_bodies=expand_bodies,
             )
 
             response = await gmail_service.list_threads(request)
 
+            threads = await _dump_all(
+                gmail_service.fragment_cache,
+                response.threads,
+                [
+                    (
+                        "thread",
+                        thread.id,
+                        thread.history_id,
+                        request.message_format.value,
+                        expand_bodies,
+                    )
+                    if thread.history_id
+                    else None
+                    for thread in response.threads
+                ],
+            )
+
             result = {
-                "threads": [thread.model_dump() for thread in response.threads],
+                "threads": threads,
                 "next_page_token": response.next_page_token,
                 "result_size_estimate": response.result_size_estimate,
                 "count": len(response.threads),
             }
 
-            return json.dumps(result, indent=2, default=str)
+            return dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in get_threads: {e}")
-            return json.dumps({"error": str(e)}, indent=2)
+            log_tool_error(logger, "get_threads", e)
+            return dumps({"error": str(e)})
 
     @mcp.tool()
     async def gmail_get_thread_by_id(
@@ -193,22 +288,21 @@ def register_advanced_tools(mcp: FastMCP):
         Returns:
             JSON string with thread details
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = get_context_gmail_service(ctx)
         try:
             thread = await gmail_service.get_thread(thread_id, format)
 
             result = {
                 "success": True,
-                "thread": thread.model_dump(),
+                "thread": model_fragment(thread),
                 "message_count": len(thread.messages),
             }
 
-            return json.dumps(result, indent=2, default=str)
+            return dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in get_thread_by_id: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            log_tool_error(logger, "get_thread_by_id", e)
+            return dumps({"error": str(e), "success": False})
 
     @mcp.tool()
     async def gmail_create_draft(
@@ -238,15 +332,12 @@ def register_advanced_tools(mcp: FastMCP):
         Returns:
             JSON string with draft creation status
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            if not body_text and not body_html:
-                return json.dumps({"error": "Either body_text or body_html must be provided"})
+        if not body_text and not body_html:
+            return dumps({"error": "Either body_text or body_html must be provided"})
 
-            # GmailService is injected via dependency injection
-
-            request = CreateDraftRequest(
+        gmail_service: GmailService = get_context_gmail_service(ctx)
+        try:
+            request = CreateDraftRequest.model_construct(
                 to=to,
                 subject=subject,
                 body_text=body_text,
@@ -262,16 +353,16 @@ def register_advanced_tools(mcp: FastMCP):
             result = {
                 "success": True,
                 "draft_id": draft_id,
-                "message": f"Draft created successfully for {', '.join(to)}",
+                "message": f"Draft created successfully for {_format_recipients(to)}",
             }
 
-            return json.dumps(result, indent=2)
+            return dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in create_draft: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            log_tool_error(logger, "create_draft", e)
+            return dumps({"error": str(e), "success": False})
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     async def gmail_get_drafts(
         ctx: Context,
         max_results: int = 10,
@@ -295,12 +386,8 @@ def register_advanced_tools(mcp: FastMCP):
         Returns:
             JSON string containing drafts list
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = get_context_gmail_service(ctx)
         try:
-            # Import DraftListRequest
-            from ..models import DraftListRequest
-
             request = DraftListRequest(
                 max_results=max_results,
                 page_token=page_token,
@@ -312,18 +399,34 @@ def register_advanced_tools(mcp: FastMCP):
 
             response = await gmail_service.list_drafts(request)
 
+            drafts = await _dump_all(
+                gmail_service.fragment_cache,
+                response.drafts,
+                [
+                    (
+                        "draft",
+                        draft.id,
+                        draft.message.history_id,
+                        request.message_format.value,
+                    )
+                    if draft.message.history_id
+                    else None
+                    for draft in response.drafts
+                ],
+            )
+
             result = {
-                "drafts": [draft.model_dump() for draft in response.drafts],
+                "drafts": drafts,
                 "next_page_token": response.next_page_token,
                 "result_size_estimate": response.result_size_estimate,
                 "count": len(response.drafts),
             }
 
-            return json.dumps(result, indent=2, default=str)
+            return dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in get_drafts: {e}")
-            return json.dumps({"error": str(e)}, indent=2)
+            log_tool_error(logger, "get_drafts", e)
+            return dumps({"error": str(e)})
 
     @mcp.tool()
     async def gmail_get_draft_by_id(
@@ -341,22 +444,21 @@ def register_advanced_tools(mcp: FastMCP):
         Returns:
             JSON string with draft details
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = get_context_gmail_service(ctx)
         try:
             draft = await gmail_service.get_draft(draft_id, format)
 
             result = {
                 "success": True,
-                "draft": draft.model_dump(),
+                "draft": model_fragment(draft),
                 "message": f"Draft {draft_id} retrieved successfully",
             }
 
-            return json.dumps(result, indent=2, default=str)
+            return dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in get_draft_by_id: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            log_tool_error(logger, "get_draft_by_id", e)
+            return dumps({"error": str(e), "success": False})
 
     @mcp.tool()
     async def gmail_send_draft(
@@ -372,27 +474,24 @@ def register_advanced_tools(mcp: FastMCP):
         Returns:
             JSON string with send status and message ID
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = get_context_gmail_service(ctx)
         try:
             # Send the draft email
 
             message_id = await gmail_service.send_draft(draft_id)
 
-            result = {
-                "success": True,
-                "message_id": message_id,
-                "draft_id": draft_id,
-                "message": "Draft sent successfully",
-            }
-
-            return json.dumps(result, indent=2)
+            return render(
+                _SEND_DRAFT_TEMPLATE,
+                message_id=message_id,
+                draft_id=draft_id,
+                message="Draft sent successfully",
+            )
 
         except Exception as e:
-            logger.error(f"Error in send_draft: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            log_tool_error(logger, "send_draft", e)
+            return dumps({"error": str(e), "success": False})
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     async def gmail_get_attachments(
         ctx: Context,
         message_id: str,
@@ -408,34 +507,31 @@ def register_advanced_tools(mcp: FastMCP):
         Returns:
             JSON string with attachment data or list of attachments
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = get_context_gmail_service(ctx)
         try:
-            # GmailService is injected via dependency injection
-
             if attachment_id:
                 # Download specific attachment
                 attachment = await gmail_service.get_attachment(message_id, attachment_id)
 
                 result = {
                     "success": True,
-                    "attachment": attachment.model_dump(),
+                    "attachment": model_fragment(attachment),
                     "message": f"Attachment {attachment_id} downloaded successfully",
                 }
             else:
-                # Get message to list all attachments
-                message = await gmail_service.get_message(message_id)
+                # Only attachment metadata is needed, not the message bodies
+                attachments = await gmail_service.list_attachments(message_id)
 
                 result = {
                     "success": True,
                     "message_id": message_id,
-                    "attachments": [att.model_dump() for att in message.attachments],
-                    "count": len(message.attachments),
-                    "message": f"Found {len(message.attachments)} attachments",
+                    "attachments": [model_fragment(att) for att in attachments],
+                    "count": len(attachments),
+                    "message": f"Found {len(attachments)} attachments",
                 }
 
-            return json.dumps(result, indent=2, default=str)
+            return dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in get_attachments: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            log_tool_error(logger, "get_attachments", e)
+            return dumps({"error": str(e), "success": False})
@@ -1,422 +1,484 @@
 """MCP tools for email sending and management operations."""
 
-from typing import Optional, List
-import json
+from typing import Awaitable, Callable, Optional, List, TypeVar
 import logging
 
 from mcp.server import FastMCP
-from fastapi import HTTPException
 from mcp.server.fastmcp.server import Context
 
 from ..services import GmailService
-from ..models import SendEmailRequest, ModifyLabelsRequest, CreateLabelRequest
-from ..dependencies import get_access_token, get_gmail_service
+from ..models import SendEmailRequest, ModifyLabelsRequest, CreateLabelRequest, MessageFormat
+from ..core.errors import log_tool_error
+from ..core.serialization import dumps, model_fragment, render
+from ..dependencies import get_context_gmail_service
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Subject prefix added to replies unless the subject already has one (any case)
+_REPLY_PREFIX = "Re: "
+
+# Fixed label changes of the single-email tools, built once and shared (the models are frozen)
+_MARK_READ_REQUEST = ModifyLabelsRequest(remove_label_ids=["UNREAD"])
+_MARK_UNREAD_REQUEST = ModifyLabelsRequest(add_label_ids=["UNREAD"])
+_ARCHIVE_REQUEST = ModifyLabelsRequest(remove_label_ids=["INBOX"])
+_UNARCHIVE_REQUEST = ModifyLabelsRequest(add_label_ids=["INBOX"])
+# Trashed messages can be restored for 30 days, and trashing needs only the gmail.modify
+# scope (permanent batchDelete needs full mail.google.com access)
+_TRASH_REQUEST = ModifyLabelsRequest(add_label_ids=["TRASH"])
+
+# Pre-serialized success envelopes for the fixed-shape responses, filled by render
+_STATUS_TEMPLATE = '{{"success":true,"message_id":{message_id},"message":{message}}}'
+_REPLY_TEMPLATE = (
+    '{{"success":true,"reply_message_id":{reply_message_id},'
+    '"original_message_id":{original_message_id},"message":{message}}}'
+)
 
-def register_management_tools(mcp: FastMCP):
-    """Register email management tools with MCP server.
+
+async def _run_tool(
+    ctx: Context,
+    tool_name: str,
+    operation: Callable[[GmailService], Awaitable[T]],
+    on_success: Callable[[T], str],
+) -> str:
+    """Run a tool's Gmail operation and turn any failure into an error response.
 
     Args:
-        mcp: FastMCP server instance
+        ctx: MCP context of the tool call
+        tool_name: Tool name used when logging errors
+        operation: Coroutine function performing the Gmail calls
+        on_success: Builds the JSON response from the operation's result
+
+    Returns:
+        JSON string with the operation result or the error
     """
+    gmail_service: GmailService = get_context_gmail_service(ctx)
+    try:
+        return on_success(await operation(gmail_service))
+    except Exception as e:
+        log_tool_error(logger, tool_name, e)
+        return dumps({"error": str(e), "success": False})
+
+
+async def gmail_send_email(
+    ctx: Context,
+    to: List[str],
+    subject: str,
+    body_text: Optional[str] = None,
+    body_html: Optional[str] = None,
+    cc: Optional[List[str]] = None,
+    bcc: Optional[List[str]] = None,
+    attachments: Optional[List[str]] = None,
+) -> str:
+    """Send an email.
 
-    @mcp.tool()
-    async def gmail_send_email(
-        ctx: Context,
-        to: List[str],
-        subject: str,
-        body_text: Optional[str] = None,
-        body_html: Optional[str] = None,
-        cc: Optional[List[str]] = None,
-        bcc: Optional[List[str]] = None,
-        attachments: Optional[List[str]] = None,
-    ) -> str:
-        """Send an email.
-
-        Args:
-            to: List of recipient email addresses
-            subject: Email subject
-            body_text: Plain text body
-            body_html: HTML body
-            cc: CC recipients
-            bcc: BCC recipients
-            attachments: List of file paths to attach
-            ctx: MCP context for logging and progress
-            gmail_service: GmailService instance (injected)
-
-        Returns:
-            JSON string with send status and message ID
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            if not body_text and not body_html:
-                return json.dumps({"error": "Either body_text or body_html must be provided"})
-
-            # GmailService is configured with the access token
-
-            request = SendEmailRequest(
-                to=to,
-                subject=subject,
-                body_text=body_text,
-                body_html=body_html,
-                cc=cc,
-                bcc=bcc,
-                attachments=attachments,
-            )
+    Args:
+        to: List of recipient email addresses
+        subject: Email subject
+        body_text: Plain text body
+        body_html: HTML body
+        cc: CC recipients
+        bcc: BCC recipients
+        attachments: List of file paths to attach
+        ctx: MCP context for logging and progress
+        gmail_service: GmailService instance (injected)
+
+    Returns:
+        JSON string with send status and message ID
+    """
+    # Checked before the token lookup so invalid calls cost nothing
+    if not body_text and not body_html:
+        return dumps({"error": "Either body_text or body_html must be provided"})
+
+    # Arguments were validated against the tool signature and the body checked above
+    request = SendEmailRequest.model_construct(
+        to=to,
+        subject=subject,
+        body_text=body_text,
+        body_html=body_html,
+        cc=cc,
+        bcc=bcc,
+        attachments=attachments,
+    )
+
+    return await _run_tool(
+        ctx,
+        "send_email",
+        lambda gmail_service: gmail_service.send_message(request),
+        lambda message_id: render(
+            _STATUS_TEMPLATE,
+            message_id=message_id,
+            message=f"Email sent successfully to {', '.join(to)}",
+        ),
+    )
+
+
+async def gmail_reply_to_email(
+    ctx: Context,
+    message_id: str,
+    body_text: Optional[str] = None,
+    body_html: Optional[str] = None,
+    reply_all: bool = False,
+) -> str:
+    """Reply to an email.
 
-            message_id = await gmail_service.send_message(request)
+    Args:
+        message_id: ID of message to reply to
+        body_text: Plain text reply body
+        body_html: HTML reply body
+        reply_all: Reply to all recipients
+        ctx: MCP context for logging and progress
+
+    Returns:
+        JSON string with reply status
+    """
+    if not body_text and not body_html:
+        return dumps({"error": "Either body_text or body_html must be provided"})
+
+    async def reply(gmail_service: GmailService) -> str:
+        # Only the original's headers are needed, so skip downloading its bodies
+        original_message = await gmail_service.get_message(message_id, MessageFormat.METADATA)
+
+        to_addresses, cc_addresses = await gmail_service.reply_recipients(
+            original_message, reply_all
+        )
+
+        subject = original_message.subject or ""
+        if subject[:3].lower() != "re:":
+            subject = _REPLY_PREFIX + subject
+
+        request = SendEmailRequest.model_construct(
+            to=to_addresses,
+            cc=cc_addresses or None,
+            subject=subject,
+            body_text=body_text,
+            body_html=body_html,
+            thread_id=original_message.thread_id,
+            in_reply_to=message_id,
+        )
+
+        return await gmail_service.send_message(request)
+
+    return await _run_tool(
+        ctx,
+        "reply_to_email",
+        reply,
+        lambda reply_message_id: render(
+            _REPLY_TEMPLATE,
+            reply_message_id=reply_message_id,
+            original_message_id=message_id,
+            message="Reply sent successfully",
+        ),
+    )
+
+
+async def gmail_mark_as_read(
+    ctx: Context,
+    message_id: str,
+) -> str:
+    """Mark an email as read.
 
-            result = {
-                "success": True,
-                "message_id": message_id,
-                "message": f"Email sent successfully to {', '.join(to)}",
-            }
+    Args:
+        message_id: Message ID to mark as read
+        ctx: MCP context for logging and progress
 
-            return json.dumps(result, indent=2)
-
-        except Exception as e:
-            logger.error(f"Error sending email: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to send email: {str(e)}")
-
-    @mcp.tool()
-    async def gmail_reply_to_email(
-        ctx: Context,
-        message_id: str,
-        body_text: Optional[str] = None,
-        body_html: Optional[str] = None,
-        reply_all: bool = False,
-    ) -> str:
-        """Reply to an email.
-
-        Args:
-            message_id: ID of message to reply to
-            body_text: Plain text reply body
-            body_html: HTML reply body
-            reply_all: Reply to all recipients
-            ctx: MCP context for logging and progress
-
-        Returns:
-            JSON string with reply status
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            if not body_text and not body_html:
-                return json.dumps({"error": "Either body_text or body_html must be provided"})
-
-            # GmailService is injected via dependency injection
-
-            # Get original message to extract reply info
-            original_message = await gmail_service.get_message(message_id)
-
-            # Prepare reply
-            to_addresses = [original_message.sender] if original_message.sender else []
-
-            if reply_all and original_message.recipient:
-                # Add other recipients for reply-all (simplified)
-                # In production, you'd parse all To/CC recipients from headers
-                pass
-
-            subject = original_message.subject or ""
-            if not subject.startswith("Re:"):
-                subject = f"Re: {subject}"
-
-            request = SendEmailRequest(
-                to=to_addresses,
-                subject=subject,
-                body_text=body_text,
-                body_html=body_html,
-                thread_id=original_message.thread_id,
-                in_reply_to=message_id,
-            )
+    Returns:
+        JSON string with operation status
+    """
+    # Mark message as read by removing UNREAD label
+    return await _run_tool(
+        ctx,
+        "mark_as_read",
+        lambda gmail_service: gmail_service.modify_message_labels(message_id, _MARK_READ_REQUEST),
+        lambda _: render(_STATUS_TEMPLATE, message_id=message_id, message="Email marked as read"),
+    )
 
-            reply_message_id = await gmail_service.send_message(request)
 
-            result = {
-                "success": True,
-                "reply_message_id": reply_message_id,
-                "original_message_id": message_id,
-                "message": f"Reply sent successfully",
-            }
+async def gmail_mark_as_unread(
+    ctx: Context,
+    message_id: str,
+) -> str:
+    """Mark an email as unread.
 
-            return json.dumps(result, indent=2)
-
-        except Exception as e:
-            logger.error(f"Error in reply_to_email: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
-
-    @mcp.tool()
-    async def gmail_mark_as_read(
-        ctx: Context,
-        message_id: str,
-    ) -> str:
-        """Mark an email as read.
-
-        Args:
-            message_id: Message ID to mark as read
-            ctx: MCP context for logging and progress
-
-        Returns:
-            JSON string with operation status
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            # Mark message as read by removing UNREAD label
-
-            request = ModifyLabelsRequest(remove_label_ids=["UNREAD"])
-            await gmail_service.modify_message_labels(message_id, request)
-
-            result = {"success": True, "message_id": message_id, "message": "Email marked as read"}
-
-            return json.dumps(result, indent=2)
-
-        except Exception as e:
-            logger.error(f"Error in mark_as_read: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
-
-    @mcp.tool()
-    async def gmail_mark_as_unread(
-        ctx: Context,
-        message_id: str,
-    ) -> str:
-        """Mark an email as unread.
-
-        Args:
-            message_id: Message ID to mark as unread
-            ctx: MCP context for logging and progress
-
-        Returns:
-            JSON string with operation status
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            # Mark message as unread by adding UNREAD label
-
-            request = ModifyLabelsRequest(add_label_ids=["UNREAD"])
-            await gmail_service.modify_message_labels(message_id, request)
-
-            result = {
-                "success": True,
-                "message_id": message_id,
-                "message": "Email marked as unread",
-            }
+    Args:
+        message_id: Message ID to mark as unread
+        ctx: MCP context for logging and progress
+
+    Returns:
+        JSON string with operation status
+    """
+    # Mark message as unread by adding UNREAD label
+    return await _run_tool(
+        ctx,
+        "mark_as_unread",
+        lambda gmail_service: gmail_service.modify_message_labels(message_id, _MARK_UNREAD_REQUEST),
+        lambda _: render(_STATUS_TEMPLATE, message_id=message_id, message="Email marked as unread"),
+    )
 
-            return json.dumps(result, indent=2)
 
-        except Exception as e:
-            logger.error(f"Error in mark_as_unread: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+async def gmail_archive_email(
+    ctx: Context,
+    message_id: str,
+) -> str:
+    """Archive an email (remove from INBOX).
 
-    @mcp.tool()
-    async def gmail_archive_email(
-        ctx: Context,
-        message_id: str,
-    ) -> str:
-        """Archive an email (remove from INBOX).
+    Args:
+        message_id: Message ID to archive
+        ctx: MCP context for logging and progress
 
-        Args:
-            message_id: Message ID to archive
-            ctx: MCP context for logging and progress
+    Returns:
+        JSON string with operation status
+    """
+    # Archive email by removing INBOX label
+    return await _run_tool(
+        ctx,
+        "archive_email",
+        lambda gmail_service: gmail_service.modify_message_labels(message_id, _ARCHIVE_REQUEST),
+        lambda _: render(
+            _STATUS_TEMPLATE, message_id=message_id, message="Email archived successfully"
+        ),
+    )
+
+
+async def gmail_unarchive_email(
+    ctx: Context,
+    message_id: str,
+) -> str:
+    """Unarchive an email (add back to INBOX).
 
-        Returns:
-            JSON string with operation status
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            # Archive email by removing INBOX label
+    Args:
+        message_id: Message ID to unarchive
+        ctx: MCP context for logging and progress
 
-            request = ModifyLabelsRequest(remove_label_ids=["INBOX"])
-            await gmail_service.modify_message_labels(message_id, request)
+    Returns:
+        JSON string with operation status
+    """
+    # Unarchive email by adding INBOX label
+    return await _run_tool(
+        ctx,
+        "unarchive_email",
+        lambda gmail_service: gmail_service.modify_message_labels(message_id, _UNARCHIVE_REQUEST),
+        lambda _: render(
+            _STATUS_TEMPLATE, message_id=message_id, message="Email unarchived successfully"
+        ),
+    )
 
-            result = {
-                "success": True,
-                "message_id": message_id,
-                "message": "Email archived successfully",
-            }
 
-            return json.dumps(result, indent=2)
+async def gmail_delete_email(ctx: Context, message_id: str) -> str:
+    """Delete an email permanently.
 
-        except Exception as e:
-            logger.error(f"Error in archive_email: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+    Args:
+        message_id: Message ID to delete
+        ctx: MCP context for logging and progress
 
-    @mcp.tool()
-    async def gmail_unarchive_email(
-        ctx: Context,
-        message_id: str,
-    ) -> str:
-        """Unarchive an email (add back to INBOX).
+    Returns:
+        JSON string with operation status
+    """
+    def deleted(success: bool) -> str:
+        if success:
+            return render(
+                _STATUS_TEMPLATE, message_id=message_id, message="Email deleted successfully"
+            )
+        return dumps(
+            {"success": False, "message_id": message_id, "message": "Failed to delete email"}
+        )
 
-        Args:
-            message_id: Message ID to unarchive
-            ctx: MCP context for logging and progress
+    return await _run_tool(
+        ctx,
+        "delete_email",
+        lambda gmail_service: gmail_service.delete_message(message_id),
+        deleted,
+    )
 
-        Returns:
-            JSON string with operation status
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            # Unarchive email by adding INBOX label
 
-            request = ModifyLabelsRequest(add_label_ids=["INBOX"])
-            await gmail_service.modify_message_labels(message_id, request)
+async def gmail_add_label(ctx: Context, message_id: str, label_ids: List[str]) -> str:
+    """Add labels to an email.
 
-            result = {
-                "success": True,
-                "message_id": message_id,
-                "message": "Email unarchived successfully",
-            }
+    Args:
+        message_id: Message ID
+        label_ids: List of label IDs to add
+        ctx: MCP context for logging and progress
 
-            return json.dumps(result, indent=2)
-
-        except Exception as e:
-            logger.error(f"Error in unarchive_email: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
-
-    @mcp.tool()
-    async def gmail_delete_email(ctx: Context, message_id: str) -> str:
-        """Delete an email permanently.
-
-        Args:
-            message_id: Message ID to delete
-            ctx: MCP context for logging and progress
-
-        Returns:
-            JSON string with operation status
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            success = await gmail_service.delete_message(message_id)
-
-            if success:
-                result = {
-                    "success": True,
-                    "message_id": message_id,
-                    "message": "Email deleted successfully",
-                }
-            else:
-                result = {
-                    "success": False,
-                    "message_id": message_id,
-                    "message": "Failed to delete email",
-                }
-
-            return json.dumps(result, indent=2)
-
-        except Exception as e:
-            logger.error(f"Error in delete_email: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
-
-    @mcp.tool()
-    async def gmail_add_label(ctx: Context, message_id: str, label_ids: List[str]) -> str:
-        """Add labels to an email.
-
-        Args:
-            message_id: Message ID
-            label_ids: List of label IDs to add
-            ctx: MCP context for logging and progress
-
-        Returns:
-            JSON string with operation status
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            request = ModifyLabelsRequest(add_label_ids=label_ids)
-            updated_message = await gmail_service.modify_message_labels(message_id, request)
-
-            result = {
+    Returns:
+        JSON string with operation status
+    """
+    request = ModifyLabelsRequest.model_construct(add_label_ids=label_ids)
+    return await _run_tool(
+        ctx,
+        "add_label",
+        lambda gmail_service: gmail_service.modify_message_labels(message_id, request),
+        lambda updated_message: dumps(
+            {
                 "success": True,
                 "message_id": message_id,
                 "added_labels": label_ids,
                 "current_labels": updated_message.label_ids,
                 "message": f"Labels {', '.join(label_ids)} added successfully",
             }
+        ),
+    )
 
-            return json.dumps(result, indent=2)
-
-        except Exception as e:
-            logger.error(f"Error in add_label: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
 
-    @mcp.tool()
-    async def gmail_remove_label(ctx: Context, message_id: str, label_ids: List[str]) -> str:
-        """Remove labels from an email.
+async def gmail_remove_label(ctx: Context, message_id: str, label_ids: List[str]) -> str:
+    """Remove labels from an email.
 
-        Args:
-            message_id: Message ID
-            label_ids: List of label IDs to remove
-            ctx: MCP context for logging and progress
-
-        Returns:
-            JSON string with operation status
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            request = ModifyLabelsRequest(remove_label_ids=label_ids)
-            updated_message = await gmail_service.modify_message_labels(message_id, request)
+    Args:
+        message_id: Message ID
+        label_ids: List of label IDs to remove
+        ctx: MCP context for logging and progress
 
-            result = {
+    Returns:
+        JSON string with operation status
+    """
+    request = ModifyLabelsRequest.model_construct(remove_label_ids=label_ids)
+    return await _run_tool(
+        ctx,
+        "remove_label",
+        lambda gmail_service: gmail_service.modify_message_labels(message_id, request),
+        lambda updated_message: dumps(
+            {
                 "success": True,
                 "message_id": message_id,
                 "removed_labels": label_ids,
                 "current_labels": updated_message.label_ids,
                 "message": f"Labels {', '.join(label_ids)} removed successfully",
             }
+        ),
+    )
 
-            return json.dumps(result, indent=2)
-
-        except Exception as e:
-            logger.error(f"Error in remove_label: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
-
-    @mcp.tool()
-    async def gmail_create_label(
-        ctx: Context,
-        name: str,
-        message_list_visibility: str = "show",
-        label_list_visibility: str = "labelShow",
-    ) -> str:
-        """Create a new Gmail label.
-
-        Args:
-            name: Label name
-            message_list_visibility: Message list visibility (show/hide)
-            label_list_visibility: Label list visibility (labelShow/labelHide)
-            ctx: MCP context for logging and progress
-
-        Returns:
-            JSON string with created label information
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            request = CreateLabelRequest(
-                name=name,
-                message_list_visibility=message_list_visibility,
-                label_list_visibility=label_list_visibility,
-            )
 
-            label = await gmail_service.create_label(request)
+async def gmail_batch_modify_labels(
+    ctx: Context,
+    message_ids: List[str],
+    add_label_ids: Optional[List[str]] = None,
+    remove_label_ids: Optional[List[str]] = None,
+) -> str:
+    """Add and remove labels on many emails at once.
+
+    Use this instead of repeated single-email calls, e.g. to mark several emails
+    as read (remove UNREAD) or archive them (remove INBOX).
+
+    Args:
+        message_ids: Message IDs to modify
+        add_label_ids: Label IDs to add to every message
+        remove_label_ids: Label IDs to remove from every message
+        ctx: MCP context for logging and progress
+
+    Returns:
+        JSON string with operation status and the IDs that could not be modified
+    """
+    if not add_label_ids and not remove_label_ids:
+        return dumps({"error": "Either add_label_ids or remove_label_ids must be provided"})
+
+    request = ModifyLabelsRequest.model_construct(
+        add_label_ids=add_label_ids, remove_label_ids=remove_label_ids
+    )
+    return await _run_tool(
+        ctx,
+        "batch_modify_labels",
+        lambda gmail_service: gmail_service.batch_modify_labels(message_ids, request),
+        lambda failed: dumps(
+            {
+                "success": not failed,
+                "message_ids": message_ids,
+                "failed_message_ids": failed,
+                "added_labels": add_label_ids or [],
+                "removed_labels": remove_label_ids or [],
+                "message": f"Labels updated on {len(message_ids) - len(failed)} of "
+                f"{len(message_ids)} emails",
+            }
+        ),
+    )
+
 
-            result = {
+async def gmail_batch_delete_emails(ctx: Context, message_ids: List[str]) -> str:
+    """Move many emails to the trash at once.
+
+    Trashed emails can be restored from the trash for 30 days.
+
+    Args:
+        message_ids: Message IDs to delete
+        ctx: MCP context for logging and progress
+
+    Returns:
+        JSON string with operation status and the IDs that could not be trashed
+    """
+    return await _run_tool(
+        ctx,
+        "batch_delete_emails",
+        lambda gmail_service: gmail_service.batch_modify_labels(message_ids, _TRASH_REQUEST),
+        lambda failed: dumps(
+            {
+                "success": not failed,
+                "message_ids": message_ids,
+                "failed_message_ids": failed,
+                "message": f"{len(message_ids) - len(failed)} of {len(message_ids)} emails "
+                "moved to trash",
+            }
+        ),
+    )
+
+
+async def gmail_create_label(
+    ctx: Context,
+    name: str,
+    message_list_visibility: str = "show",
+    label_list_visibility: str = "labelShow",
+) -> str:
+    """Create a new Gmail label.
+
+    Args:
+        name: Label name
+        message_list_visibility: Message list visibility (show/hide)
+        label_list_visibility: Label list visibility (labelShow/labelHide)
+        ctx: MCP context for logging and progress
+
+    Returns:
+        JSON string with created label information
+    """
+    request = CreateLabelRequest.model_construct(
+        name=name,
+        message_list_visibility=message_list_visibility,
+        label_list_visibility=label_list_visibility,
+    )
+    return await _run_tool(
+        ctx,
+        "create_label",
+        lambda gmail_service: gmail_service.create_label(request),
+        lambda label: dumps(
+            {
                 "success": True,
-                "label": label.model_dump(),
+                "label": model_fragment(label),
                 "message": f"Label '{name}' created successfully",
             }
+        ),
+    )
+
+
+# Defined once at import time; registration only hands them to FastMCP
+_TOOLS = (
+    gmail_send_email,
+    gmail_reply_to_email,
+    gmail_mark_as_read,
+    gmail_mark_as_unread,
+    gmail_archive_email,
+    gmail_unarchive_email,
+    gmail_delete_email,
+    gmail_add_label,
+    gmail_remove_label,
+    gmail_batch_modify_labels,
+    gmail_batch_delete_emails,
+    gmail_create_label,
+)
 
-            return json.dumps(result, indent=2, default=str)
 
-        except Exception as e:
-            logger.error(f"Error in create_label: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+def register_management_tools(mcp: FastMCP):
+    """Register email management tools with MCP server.
+
+    Args:
+        mcp: FastMCP server instance
+    """
+    for tool in _TOOLS:
+        mcp.tool()(tool)
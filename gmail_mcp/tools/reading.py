@@ -1,20 +1,506 @@
 """MCP tools for email reading operations."""
 
-from typing import Optional, List
-import json
+from typing import Annotated, Awaitable, Callable, Optional, List
+import asyncio
+import functools
+import inspect
 import logging
 
 from mcp.server import FastMCP
 from fastapi import HTTPException
 from mcp.server.fastmcp.server import Context
+from pydantic import BaseModel, Field, TypeAdapter
 
 from ..services import GmailService
-from ..models import EmailListRequest, SearchEmailsRequest, MessageFormat
-from ..dependencies import get_access_token, get_gmail_service
+from ..models import (
+    EmailListRequest,
+    EmailBatchResponse,
+    SearchEmailsRequest,
+    MessageFormat,
+    Label,
+)
+from ..core.errors import log_tool_error
+from ..core.serialization import dumps_adapted, dumps_model
+from ..dependencies import get_context_gmail_service
 
 
 logger = logging.getLogger(__name__)
 
+# Built once at import; constructing an adapter compiles its serializer
+_LABELS_ADAPTER = TypeAdapter(List[Label])
+
+# Page size bounds of the listing requests, checked by FastMCP against the tool schema
+# so the request models can be built without validating again
+_MaxResults = Annotated[int, Field(ge=1, le=500)]
+
+# Formats carrying full bodies, whose responses can run to megabytes
+_LARGE_FORMATS = frozenset({MessageFormat.FULL, MessageFormat.RAW})
+
+# Rough response bytes per message in each format, and the largest estimated response a
+# single call may produce; bigger requests are rejected before anything is fetched
+_FORMAT_BYTES = {
+    MessageFormat.MINIMAL: 200,
+    MessageFormat.METADATA: 2_000,
+    MessageFormat.COMPACT: 5_000,
+    MessageFormat.FULL: 50_000,
+    MessageFormat.RAW: 80_000,
+}
+RESPONSE_SIZE_BUDGET = 20_000_000
+
+# Formats list_messages_columnar can lay out as columns
+_COLUMNAR_FORMATS = frozenset({MessageFormat.MINIMAL, MessageFormat.COMPACT})
+
+
+def _check_response_size(message_count: int, format: MessageFormat) -> None:
+    """Reject a call whose estimated response would exceed RESPONSE_SIZE_BUDGET.
+
+    Args:
+        message_count: Number of messages requested
+        format: Message format requested
+
+    Raises:
+        HTTPException: 413 naming the largest allowed count for the format
+    """
+    per_message = _FORMAT_BYTES[format]
+    if message_count * per_message > RESPONSE_SIZE_BUDGET:
+        limit = RESPONSE_SIZE_BUDGET // per_message
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {limit} emails can be fetched per call in {format.value} format; "
+            "reduce max_results or use a lighter format",
+        )
+
+
+def _check_columnar(columnar: bool, format: MessageFormat) -> None:
+    """Reject a columnar request in a format that has no columnar layout.
+
+    Args:
+        columnar: Whether columnar output was requested
+        format: Message format requested
+
+    Raises:
+        HTTPException: 400 when columnar output is requested in another format
+    """
+    if columnar and format not in _COLUMNAR_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Columnar output supports MINIMAL and COMPACT formats, not {format.value}",
+        )
+
+
+async def _dump_response(response: BaseModel, format: MessageFormat) -> str:
+    """Serialize a tool response, in a worker thread for formats with full bodies.
+
+    Encoding a multi-megabyte response on the event loop would stall every other
+    tool call, while small ones are cheaper to encode in place than to hand off.
+
+    Args:
+        response: Response model
+        format: Message format the response was fetched in
+
+    Returns:
+        JSON string
+    """
+    if format in _LARGE_FORMATS:
+        return await asyncio.to_thread(dumps_model, response)
+    return dumps_model(response)
+
+
+def _memoized(tool: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """Answer repeat calls of a reading tool from the caller's response cache.
+
+    Responses are cached on the caller's pooled GmailService, so entries are per
+    user, expire after a few seconds and are dropped by any write through the
+    service. Failed calls are not cached.
+
+    Args:
+        tool: Tool coroutine function taking the MCP context as ``ctx``
+
+    Returns:
+        Wrapped tool with the same signature
+    """
+    signature = inspect.signature(tool)
+
+    @functools.wraps(tool)
+    async def wrapper(*args, **kwargs) -> str:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (tool.__name__,) + tuple(
+            tuple(value) if isinstance(value, list) else value
+            for name, value in bound.arguments.items()
+            if name != "ctx"
+        )
+        cache = get_context_gmail_service(bound.arguments["ctx"]).response_cache
+        response = cache.get(key)
+        if response is None:
+            response = await tool(*args, **kwargs)
+            cache.set(key, response)
+        return response
+
+    return wrapper
+
+
+@_memoized
+async def gmail_get_emails(
+    ctx: Context,
+    max_results: _MaxResults = 10,
+    label_ids: Optional[List[str]] = None,
+    query: Optional[str] = None,
+    after_date: Optional[str] = None,
+    before_date: Optional[str] = None,
+    newer_than: Optional[str] = None,
+    older_than: Optional[str] = None,
+    include_spam_trash: bool = False,
+    page_token: Optional[str] = None,
+    format: MessageFormat = MessageFormat.COMPACT,
+    columnar: bool = False,
+) -> str:
+    """Get list of emails from Gmail.
+
+    Args:
+        max_results: Maximum number of emails to return (1-500)
+        label_ids: Filter by label IDs (e.g., ['INBOX', 'UNREAD'])
+        query: Gmail search query (e.g., 'from:example@gmail.com')
+        after_date: Get emails after this date (YYYY-MM-DD or YYYY/MM/DD)
+        before_date: Get emails before this date (YYYY-MM-DD or YYYY/MM/DD)
+        newer_than: Get emails newer than timeframe (e.g., '1d', '2w', '3m', '1y')
+        older_than: Get emails older than timeframe (e.g., '1d', '2w', '3m', '1y')
+        include_spam_trash: Include spam and trash emails
+        page_token: Token for pagination
+        format: Message format (MINIMAL, COMPACT, FULL, RAW, METADATA)
+        columnar: Return one list per field instead of a list of messages
+            (MINIMAL and COMPACT only)
+
+    Returns:
+        JSON string with email list response
+
+    Format Details:
+        - MINIMAL: id, threadId, labelIds only
+        - COMPACT: MINIMAL + subject, sender, date, body_text (recommended)
+        - FULL: Complete message including body, headers, attachments
+        - RAW: Raw RFC2822 message
+        - METADATA: Headers and labels only (no body)
+    """
+    _check_response_size(max_results, format)
+    _check_columnar(columnar, format)
+
+    gmail_service: GmailService = get_context_gmail_service(ctx)
+    try:
+        logger.info("Fetching %s emails with format %s", max_results, format)
+
+        # GmailService is injected with the access token already configured
+
+        # Create request object
+        email_request = EmailListRequest.model_construct(
+            max_results=max_results,
+            label_ids=label_ids or [],
+            query=query,
+            after_date=after_date,
+            before_date=before_date,
+            newer_than=newer_than,
+            older_than=older_than,
+            include_spam_trash=include_spam_trash,
+            page_token=page_token,
+        )
+
+        if columnar:
+            columns = await gmail_service.list_messages_columnar(email_request, format)
+            logger.info("Retrieved %s emails", len(columns.ids))
+            return dumps_model(columns)
+
+        # Get emails with specified format
+        response = await gmail_service.list_messages(email_request, format)
+
+        logger.info("Retrieved %s emails", len(response.messages))
+
+        return await _dump_response(response, format)
+
+    except Exception as e:
+        log_tool_error(logger, "get_emails", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get emails: {str(e)}")
+
+
+@_memoized
+async def gmail_get_email_by_id(
+    ctx: Context,
+    email_id: str,
+    format: MessageFormat = MessageFormat.COMPACT,
+) -> str:
+    """Get specific email by ID.
+
+    Args:
+        email_id: Gmail message ID
+        format: Email format (MINIMAL, COMPACT, FULL, RAW, METADATA)
+        ctx: MCP context for logging and progress
+
+    Returns:
+        JSON string with email details
+
+    Format Details:
+        - MINIMAL: id, threadId, labelIds only (fastest)
+        - COMPACT: MINIMAL + subject, sender, date, body_text (recommended)
+        - FULL: Complete message including body, headers, attachments
+        - RAW: Raw RFC2822 message
+        - METADATA: Headers and labels only (no body)
+    """
+    gmail_service: GmailService = get_context_gmail_service(ctx)
+    try:
+        logger.info("Fetching email %s with format %s", email_id, format)
+
+        # GmailService is injected with the access token already configured
+        message = await gmail_service.get_message(email_id, format)
+
+        logger.info("Retrieved email: %s", message.subject)
+
+        return await _dump_response(message, format)
+
+    except Exception as e:
+        log_tool_error(logger, "get_email_by_id", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get email: {str(e)}")
+
+
+@_memoized
+async def gmail_get_emails_by_ids(
+    ctx: Context,
+    email_ids: List[str],
+    format: MessageFormat = MessageFormat.COMPACT,
+) -> str:
+    """Get several emails by ID in one call.
+
+    Prefer this over repeated gmail_get_email_by_id calls, e.g. to read the
+    full bodies of search results.
+
+    Args:
+        email_ids: Gmail message IDs
+        format: Email format (MINIMAL, COMPACT, FULL, RAW, METADATA)
+        ctx: MCP context for logging and progress
+
+    Returns:
+        JSON string with the emails in the order of email_ids, and an error per ID
+        that could not be fetched (e.g. a deleted message)
+    """
+    _check_response_size(len(email_ids), format)
+
+    gmail_service: GmailService = get_context_gmail_service(ctx)
+    try:
+        logger.info("Fetching %s emails by ID with format %s", len(email_ids), format)
+
+        messages, errors = await gmail_service.batch_get_messages(email_ids, format)
+
+        logger.info("Retrieved %s emails, %s failed", len(messages), len(errors))
+
+        response = EmailBatchResponse(messages=list(messages.values()), errors=errors)
+        return await _dump_response(response, format)
+
+    except Exception as e:
+        log_tool_error(logger, "get_emails_by_ids", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get emails: {str(e)}")
+
+
+@_memoized
+async def gmail_search_emails(
+    ctx: Context,
+    query: str,
+    max_results: _MaxResults = 10,
+    label_ids: Optional[List[str]] = None,
+    after_date: Optional[str] = None,
+    before_date: Optional[str] = None,
+    newer_than: Optional[str] = None,
+    older_than: Optional[str] = None,
+    include_spam_trash: bool = False,
+    page_token: Optional[str] = None,
+    format: MessageFormat = MessageFormat.COMPACT,
+    columnar: bool = False,
+) -> str:
+    """Search emails using Gmail search syntax.
+
+    Args:
+        query: Gmail search query (e.g., 'from:example@gmail.com subject:urgent')
+        max_results: Maximum number of results (1-500)
+        label_ids: Filter by label IDs
+        after_date: Search emails after this date (YYYY-MM-DD or YYYY/MM/DD)
+        before_date: Search emails before this date (YYYY-MM-DD or YYYY/MM/DD)
+        newer_than: Search emails newer than timeframe (e.g., '1d', '2w', '3m', '1y')
+        older_than: Search emails older than timeframe (e.g., '1d', '2w', '3m', '1y')
+        include_spam_trash: Include spam and trash in search
+        page_token: Token for pagination
+        format: Message format (MINIMAL, COMPACT, FULL, RAW, METADATA)
+        columnar: Return one list per field instead of a list of messages
+            (MINIMAL and COMPACT only)
+        ctx: MCP context for logging and progress
+
+    Returns:
+        JSON string with search results
+
+    Format Details:
+        - MINIMAL: id, threadId, labelIds only (fastest, but limited info)
+        - COMPACT: MINIMAL + subject, sender, date, body_text (recommended for search)
+        - FULL: Complete message including body, headers, attachments
+        - RAW: Raw RFC2822 message
+        - METADATA: Headers and labels only (no body)
+    """
+    _check_response_size(max_results, format)
+    _check_columnar(columnar, format)
+
+    gmail_service: GmailService = get_context_gmail_service(ctx)
+    try:
+        logger.info("Searching emails with query: %s, format: %s", query, format)
+
+        search_request = SearchEmailsRequest.model_construct(
+            query=query,
+            max_results=max_results,
+            label_ids=label_ids or [],
+            after_date=after_date,
+            before_date=before_date,
+            newer_than=newer_than,
+            older_than=older_than,
+            include_spam_trash=include_spam_trash,
+            page_token=page_token,
+        )
+
+        if columnar:
+            columns = await gmail_service.list_messages_columnar(search_request, format)
+            logger.info("Found %s matching emails", len(columns.ids))
+            return dumps_model(columns)
+
+        response = await gmail_service.search_messages(search_request, format)
+
+        logger.info("Found %s matching emails", len(response.messages))
+
+        return await _dump_response(response, format)
+
+    except Exception as e:
+        log_tool_error(logger, "search_emails", e)
+        raise HTTPException(status_code=500, detail=f"Failed to search emails: {str(e)}")
+
+
+@_memoized
+async def gmail_get_labels(ctx: Context) -> str:
+    """Get all Gmail labels.
+
+    Args:
+        ctx: MCP context for logging and progress
+
+    Returns:
+        JSON string with labels list
+    """
+    gmail_service: GmailService = get_context_gmail_service(ctx)
+    try:
+        logger.info("Fetching Gmail labels")
+
+        # GmailService is injected with the access token already configured
+        labels = (await gmail_service.list_labels()).labels
+
+        logger.info("Retrieved %s labels", len(labels))
+
+        return dumps_adapted(_LABELS_ADAPTER, labels)
+
+    except Exception as e:
+        log_tool_error(logger, "get_labels", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get labels: {str(e)}")
+
+
+@_memoized
+async def gmail_get_profile(ctx: Context) -> str:
+    """Get Gmail profile information.
+
+    Args:
+        ctx: MCP context for logging and progress
+
+    Returns:
+        JSON string with profile information
+    """
+    gmail_service: GmailService = get_context_gmail_service(ctx)
+    try:
+        logger.info("Fetching Gmail profile")
+
+        profile = await gmail_service.get_profile()
+
+        logger.info("Retrieved profile for %s", profile.email_address)
+
+        return dumps_model(profile)
+
+    except Exception as e:
+        log_tool_error(logger, "get_profile", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get profile: {str(e)}")
+
+
+@_memoized
+async def gmail_get_my_sent_emails(
+    ctx: Context,
+    max_results: _MaxResults = 10,
+    after_date: Optional[str] = None,
+    before_date: Optional[str] = None,
+    newer_than: Optional[str] = None,
+    older_than: Optional[str] = None,
+    query: Optional[str] = None,
+    page_token: Optional[str] = None,
+    format: MessageFormat = MessageFormat.COMPACT,
+) -> str:
+    """Get emails sent by the authenticated user.
+
+    Args:
+        max_results: Maximum number of sent emails to return (1-500)
+        after_date: Get sent emails after this date (YYYY-MM-DD or YYYY/MM/DD)
+        before_date: Get sent emails before this date (YYYY-MM-DD or YYYY/MM/DD)
+        newer_than: Get sent emails newer than timeframe (e.g., '1d', '2w', '3m', '1y')
+        older_than: Get sent emails older than timeframe (e.g., '1d', '2w', '3m', '1y')
+        query: Additional Gmail search query to combine with sent filter
+        page_token: Token for pagination
+        format: Message format (MINIMAL, COMPACT, FULL, RAW, METADATA)
+
+    Returns:
+        JSON string with sent emails list response
+
+    Format Details:
+        - MINIMAL: id, threadId, labelIds only (fastest, but limited info)
+        - COMPACT: MINIMAL + subject, sender, date, body_text (recommended)
+        - FULL: Complete message including body, headers, attachments
+        - RAW: Raw RFC2822 message
+        - METADATA: Headers and labels only (no body)
+    """
+    _check_response_size(max_results, format)
+
+    gmail_service: GmailService = get_context_gmail_service(ctx)
+    try:
+        logger.info("Fetching %s sent emails with format %s", max_results, format)
+
+        # Create request object with SENT label filter
+        email_request = EmailListRequest.model_construct(
+            max_results=max_results,
+            label_ids=["SENT"],  # Always filter by SENT label
+            query=query,
+            after_date=after_date,
+            before_date=before_date,
+            newer_than=newer_than,
+            older_than=older_than,
+            include_spam_trash=False,  # Don't include spam/trash for sent emails
+            page_token=page_token,
+        )
+
+        # Get emails with specified format
+        response = await gmail_service.list_messages(email_request, format)
+
+        logger.info("Retrieved %s sent emails", len(response.messages))
+
+        return await _dump_response(response, format)
+
+    except Exception as e:
+        log_tool_error(logger, "get_sent_emails", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get sent emails: {str(e)}")
+
+
+# Defined once at import time; registration only hands them to FastMCP
+_TOOLS = (
+    gmail_get_emails,
+    gmail_get_email_by_id,
+    gmail_get_emails_by_ids,
+    gmail_search_emails,
+    gmail_get_labels,
+    gmail_get_profile,
+    gmail_get_my_sent_emails,
+)
+
 
 def register_reading_tools(mcp: FastMCP):
     """Register email reading tools with MCP server.
@@ -22,291 +508,5 @@ def register_reading_tools(mcp: FastMCP):
     Args:
         mcp: FastMCP server instance
     """
-
-    @mcp.tool()
-    async def gmail_get_emails(
-        ctx: Context,
-        max_results: int = 10,
-        label_ids: Optional[List[str]] = None,
-        query: Optional[str] = None,
-        after_date: Optional[str] = None,
-        before_date: Optional[str] = None,
-        newer_than: Optional[str] = None,
-        older_than: Optional[str] = None,
-        include_spam_trash: bool = False,
-        page_token: Optional[str] = None,
-        format: MessageFormat = MessageFormat.COMPACT,
-    ) -> str:
-        """Get list of emails from Gmail.
-
-        Args:
-            max_results: Maximum number of emails to return (1-500)
-            label_ids: Filter by label IDs (e.g., ['INBOX', 'UNREAD'])
-            query: Gmail search query (e.g., 'from:example@gmail.com')
-            after_date: Get emails after this date (YYYY-MM-DD or YYYY/MM/DD)
-            before_date: Get emails before this date (YYYY-MM-DD or YYYY/MM/DD)
-            newer_than: Get emails newer than timeframe (e.g., '1d', '2w', '3m', '1y')
-            older_than: Get emails older than timeframe (e.g., '1d', '2w', '3m', '1y')
-            include_spam_trash: Include spam and trash emails
-            page_token: Token for pagination
-            format: Message format (MINIMAL, COMPACT, FULL, RAW, METADATA)
-
-        Returns:
-            JSON string with email list response
-
-        Format Details:
-            - MINIMAL: id, threadId, labelIds only
-            - COMPACT: MINIMAL + subject, sender, date, body_text (recommended)
-            - FULL: Complete message including body, headers, attachments
-            - RAW: Raw RFC2822 message
-            - METADATA: Headers and labels only (no body)
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            logger.info(f"Fetching {max_results} emails with format {format}")
-
-            # GmailService is injected with the access token already configured
-
-            # Create request object
-            email_request = EmailListRequest(
-                max_results=max_results,
-                label_ids=label_ids or [],
-                query=query,
-                after_date=after_date,
-                before_date=before_date,
-                newer_than=newer_than,
-                older_than=older_than,
-                include_spam_trash=include_spam_trash,
-                page_token=page_token,
-            )
-
-            # Get emails with specified format
-            response = await gmail_service.list_messages(email_request, format.value)
-
-            logger.info(f"Retrieved {len(response.messages)} emails")
-
-            return json.dumps(response.model_dump(), default=str)
-
-        except Exception as e:
-            logger.error(f"Error getting emails: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to get emails: {str(e)}")
-
-    @mcp.tool()
-    async def gmail_get_email_by_id(
-        ctx: Context,
-        email_id: str,
-        format: MessageFormat = MessageFormat.COMPACT,
-    ) -> str:
-        """Get specific email by ID.
-
-        Args:
-            email_id: Gmail message ID
-            format: Email format (MINIMAL, COMPACT, FULL, RAW, METADATA)
-            ctx: MCP context for logging and progress
-
-        Returns:
-            JSON string with email details
-
-        Format Details:
-            - MINIMAL: id, threadId, labelIds only (fastest)
-            - COMPACT: MINIMAL + subject, sender, date, body_text (recommended)
-            - FULL: Complete message including body, headers, attachments
-            - RAW: Raw RFC2822 message
-            - METADATA: Headers and labels only (no body)
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            logger.info(f"Fetching email {email_id} with format {format}")
-
-            # GmailService is injected with the access token already configured
-            message = await gmail_service.get_message(email_id, format.value)
-
-            logger.info(f"Retrieved email: {message.subject}")
-
-            return json.dumps(message.model_dump(), default=str)
-
-        except Exception as e:
-            logger.error(f"Error getting email {email_id}: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to get email: {str(e)}")
-
-    @mcp.tool()
-    async def gmail_search_emails(
-        ctx: Context,
-        query: str,
-        max_results: int = 10,
-        label_ids: Optional[List[str]] = None,
-        after_date: Optional[str] = None,
-        before_date: Optional[str] = None,
-        newer_than: Optional[str] = None,
-        older_than: Optional[str] = None,
-        include_spam_trash: bool = False,
-        page_token: Optional[str] = None,
-        format: MessageFormat = MessageFormat.COMPACT,
-    ) -> str:
-        """Search emails using Gmail search syntax.
-
-        Args:
-            query: Gmail search query (e.g., 'from:example@gmail.com subject:urgent')
-            max_results: Maximum number of results (1-500)
-            label_ids: Filter by label IDs
-            after_date: Search emails after this date (YYYY-MM-DD or YYYY/MM/DD)
-            before_date: Search emails before this date (YYYY-MM-DD or YYYY/MM/DD)
-            newer_than: Search emails newer than timeframe (e.g., '1d', '2w', '3m', '1y')
-            older_than: Search emails older than timeframe (e.g., '1d', '2w', '3m', '1y')
-            include_spam_trash: Include spam and trash in search
-            page_token: Token for pagination
-            format: Message format (MINIMAL, COMPACT, FULL, RAW, METADATA)
-            ctx: MCP context for logging and progress
-
-        Returns:
-            JSON string with search results
-
-        Format Details:
-            - MINIMAL: id, threadId, labelIds only (fastest, but limited info)
-            - COMPACT: MINIMAL + subject, sender, date, body_text (recommended for search)
-            - FULL: Complete message including body, headers, attachments
-            - RAW: Raw RFC2822 message
-            - METADATA: Headers and labels only (no body)
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            logger.info(f"Searching emails with query: {query}, format: {format}")
-
-            search_request = SearchEmailsRequest(
-                query=query,
-                max_results=max_results,
-                label_ids=label_ids or [],
-                after_date=after_date,
-                before_date=before_date,
-                newer_than=newer_than,
-                older_than=older_than,
-                include_spam_trash=include_spam_trash,
-                page_token=page_token,
-            )
-
-            response = await gmail_service.search_messages(search_request, format.value)
-
-            logger.info(f"Found {len(response.messages)} matching emails")
-
-            return json.dumps(response.model_dump(), default=str)
-
-        except Exception as e:
-            logger.error(f"Error searching emails: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to search emails: {str(e)}")
-
-    @mcp.tool()
-    async def gmail_get_labels(ctx: Context) -> str:
-        """Get all Gmail labels.
-
-        Args:
-            ctx: MCP context for logging and progress
-
-        Returns:
-            JSON string with labels list
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            logger.info("Fetching Gmail labels")
-
-            # GmailService is injected with the access token already configured
-            labels = await gmail_service.list_labels()
-
-            logger.info(f"Retrieved {len(labels)} labels")
-
-            return json.dumps([label.model_dump() for label in labels], default=str)
-
-        except Exception as e:
-            logger.error(f"Error getting labels: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to get labels: {str(e)}")
-
-    @mcp.tool()
-    async def gmail_get_profile(ctx: Context) -> str:
-        """Get Gmail profile information.
-
-        Args:
-            ctx: MCP context for logging and progress
-
-        Returns:
-            JSON string with profile information
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            logger.info("Fetching Gmail profile")
-
-            profile = await gmail_service.get_profile()
-
-            logger.info(f"Retrieved profile for {profile.email_address}")
-
-            return json.dumps(profile.model_dump(), default=str)
-
-        except Exception as e:
-            logger.error(f"Error getting profile: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to get profile: {str(e)}")
-
-    @mcp.tool()
-    async def gmail_get_my_sent_emails(
-        ctx: Context,
-        max_results: int = 10,
-        after_date: Optional[str] = None,
-        before_date: Optional[str] = None,
-        newer_than: Optional[str] = None,
-        older_than: Optional[str] = None,
-        query: Optional[str] = None,
-        page_token: Optional[str] = None,
-        format: MessageFormat = MessageFormat.COMPACT,
-    ) -> str:
-        """Get emails sent by the authenticated user.
-
-        Args:
-            max_results: Maximum number of sent emails to return (1-500)
-            after_date: Get sent emails after this date (YYYY-MM-DD or YYYY/MM/DD)
-            before_date: Get sent emails before this date (YYYY-MM-DD or YYYY/MM/DD)
-            newer_than: Get sent emails newer than timeframe (e.g., '1d', '2w', '3m', '1y')
-            older_than: Get sent emails older than timeframe (e.g., '1d', '2w', '3m', '1y')
-            query: Additional Gmail search query to combine with sent filter
-            page_token: Token for pagination
-            format: Message format (MINIMAL, COMPACT, FULL, RAW, METADATA)
-
-        Returns:
-            JSON string with sent emails list response
-
-        Format Details:
-            - MINIMAL: id, threadId, labelIds only (fastest, but limited info)
-            - COMPACT: MINIMAL + subject, sender, date, body_text (recommended)
-            - FULL: Complete message including body, headers, attachments
-            - RAW: Raw RFC2822 message
-            - METADATA: Headers and labels only (no body)
-        """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            logger.info(f"Fetching {max_results} sent emails with format {format}")
-
-            # Create request object with SENT label filter
-            email_request = EmailListRequest(
-                max_results=max_results,
-                label_ids=["SENT"],  # Always filter by SENT label
-                query=query,
-                after_date=after_date,
-                before_date=before_date,
-                newer_than=newer_than,
-                older_than=older_than,
-                include_spam_trash=False,  # Don't include spam/trash for sent emails
-                page_token=page_token,
-            )
-
-            # Get emails with specified format
-            response = await gmail_service.list_messages(email_request, format.value)
-
-            logger.info(f"Retrieved {len(response.messages)} sent emails")
-
-            return json.dumps(response.model_dump(), default=str)
-
-        except Exception as e:
-            logger.error(f"Error getting sent emails: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to get sent emails: {str(e)}")
+    for tool in _TOOLS:
+        mcp.tool()(tool)
@@ -1,7 +1,9 @@
 """Gmail MCP Server - Main application with OAuth 2.0 Token Introspection."""
 
+import asyncio
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -14,14 +16,16 @@ from mcp.server.auth.settings import AuthSettings, ClientRegistrationOptions, Re
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from gmail_mcp.core.config import TransportType, settings
+from gmail_mcp.core.config import TransportType, get_settings
 from gmail_mcp.auth import gmail_token_verifier
+from gmail_mcp.dependencies import close_gmail_services
 from gmail_mcp.tools import (
     register_reading_tools,
     register_management_tools,
     register_advanced_tools,
 )
 
+settings = get_settings()
 
 # Configure logging
 logging.basicConfig(
@@ -83,6 +87,11 @@ async def lifespan(app: FastAPI):
     logger.info("Token validation: Google tokeninfo endpoint")
     logger.info("Required scopes: gmail")   
 
+    # asyncio.to_thread runs on the default executor; size it explicitly
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.thread_pool_size)
+    )
+
     if settings.transport_type == TransportType.STREAMABLE_HTTP:
         # Use the session manager's run() context manager
         async with mcp.session_manager.run():
@@ -91,6 +100,8 @@ async def lifespan(app: FastAPI):
     else:
         yield
 
+    await token_verifier.token_validator.aclose()
+    close_gmail_services()
     logger.info("Gmail MCP Server stopped")
 
 
@@ -120,13 +131,14 @@ async def root():
             "description": "All reading tools support MessageFormat parameter. COMPACT gives you essential data + body text for optimal performance.",
         },
         "tools": [
-            # Reading tools (5/5) - Now support MessageFormat
+            # Reading tools (6/6) - Now support MessageFormat
             "gmail_get_emails",
             "gmail_get_email_by_id",
+            "gmail_get_emails_by_ids",
             "gmail_search_emails",
             "gmail_get_labels",
             "gmail_get_profile",
-            # Management tools (11/11)
+            # Management tools (13/13)
             "gmail_send_email",
             "gmail_reply_to_email",
             "gmail_mark_as_read",
@@ -136,6 +148,8 @@ async def root():
             "gmail_delete_email",
             "gmail_add_label",
             "gmail_remove_label",
+            "gmail_batch_modify_labels",
+            "gmail_batch_delete_emails",
             "gmail_create_label",
             "gmail_forward_email",
             # Advanced tools (9/9)
@@ -178,7 +192,7 @@ app.mount("", mcp_app)
 
 
 if __name__ == "__main__":
-    logger.info(f"Starting Gmail MCP Server on {settings.server_host}:{settings.server_port}")
+    logger.info("Starting Gmail MCP Server on %s:%s", settings.server_host, settings.server_port)
 
     uvicorn.run(
         mcp_app,
@@ -68,7 +68,7 @@ class GmailTester:
     ) -> dict:
         """Get list of emails from Gmail."""
         try:
-            logger.info(f"📬 Getting {max_results} emails with format {format}")
+            logger.info("📬 Getting %s emails with format %s", max_results, format)
 
             request = EmailListRequest(
                 max_results=max_results,
@@ -83,7 +83,7 @@ class GmailTester:
             )
 
             response = await self.service.list_messages(request, format.value)
-            logger.info(f"✅ Retrieved {len(response.messages)} emails")
+            logger.info("✅ Retrieved %s emails", len(response.messages))
 
             return {
                 "success": True,
@@ -94,7 +94,7 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error getting emails: {e}")
+            logger.error("❌ Error getting emails: %s", e)
             return {"success": False, "error": str(e)}
 
     async def get_my_sent_emails(
@@ -110,7 +110,7 @@ class GmailTester:
     ) -> dict:
         """Get emails sent by the authenticated user."""
         try:
-            logger.info(f"📤 Getting {max_results} sent emails with format {format}")
+            logger.info("📤 Getting %s sent emails with format %s", max_results, format)
 
             # Use the regular get_emails method but with SENT label filter
             request = EmailListRequest(
@@ -126,7 +126,7 @@ class GmailTester:
             )
 
             response = await self.service.list_messages(request, format.value)
-            logger.info(f"✅ Retrieved {len(response.messages)} sent emails")
+            logger.info("✅ Retrieved %s sent emails", len(response.messages))
 
             return {
                 "success": True,
@@ -137,7 +137,7 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error getting sent emails: {e}")
+            logger.error("❌ Error getting sent emails: %s", e)
             return {"success": False, "error": str(e)}
 
     async def get_email_by_id(
@@ -147,15 +147,15 @@ class GmailTester:
     ) -> dict:
         """Get specific email by ID."""
         try:
-            logger.info(f"📧 Getting email {email_id} with format {format}")
+            logger.info("📧 Getting email %s with format %s", email_id, format)
 
             message = await self.service.get_message(email_id, format.value)
-            logger.info(f"✅ Retrieved email: {message.subject or 'No Subject'}")
+            logger.info("✅ Retrieved email: %s", message.subject or 'No Subject')
 
             return {"success": True, "message": message.model_dump()}
 
         except Exception as e:
-            logger.error(f"❌ Error getting email {email_id}: {e}")
+            logger.error("❌ Error getting email %s: %s", email_id, e)
             return {"success": False, "error": str(e)}
 
     async def search_emails(
@@ -173,7 +173,7 @@ class GmailTester:
     ) -> dict:
         """Search emails using Gmail search syntax."""
         try:
-            logger.info(f"🔍 Searching emails: '{query}' with format {format}")
+            logger.info("🔍 Searching emails: '%s' with format %s", query, format)
 
             request = SearchEmailsRequest(
                 query=query,
@@ -188,7 +188,7 @@ class GmailTester:
             )
 
             response = await self.service.search_messages(request, format.value)
-            logger.info(f"✅ Found {len(response.messages)} matching emails")
+            logger.info("✅ Found %s matching emails", len(response.messages))
 
             return {
                 "success": True,
@@ -199,7 +199,7 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error searching emails: {e}")
+            logger.error("❌ Error searching emails: %s", e)
             return {"success": False, "error": str(e)}
 
     async def get_labels(self) -> dict:
@@ -208,7 +208,7 @@ class GmailTester:
             logger.info("🏷️  Getting Gmail labels")
 
             labels = await self.service.list_labels()
-            logger.info(f"✅ Retrieved {len(labels.labels)} labels")
+            logger.info("✅ Retrieved %s labels", len(labels.labels))
 
             return {
                 "success": True,
@@ -217,7 +217,7 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error getting labels: {e}")
+            logger.error("❌ Error getting labels: %s", e)
             return {"success": False, "error": str(e)}
 
     async def get_profile(self) -> dict:
@@ -226,12 +226,12 @@ class GmailTester:
             logger.info("👤 Getting Gmail profile")
 
             profile = await self.service.get_profile()
-            logger.info(f"✅ Retrieved profile for {profile.email_address}")
+            logger.info("✅ Retrieved profile for %s", profile.email_address)
 
             return {"success": True, "profile": profile.model_dump()}
 
         except Exception as e:
-            logger.error(f"❌ Error getting profile: {e}")
+            logger.error("❌ Error getting profile: %s", e)
             return {"success": False, "error": str(e)}
 
     # === MANAGEMENT FUNCTIONS ===
@@ -251,7 +251,7 @@ class GmailTester:
             if not body_text and not body_html:
                 return {"success": False, "error": "Either body_text or body_html is required"}
 
-            logger.info(f"📤 Sending email to {', '.join(to)}: '{subject}'")
+            logger.info("📤 Sending email to %s: '%s'", ', '.join(to), subject)
 
             request = SendEmailRequest(
                 to=to,
@@ -264,7 +264,7 @@ class GmailTester:
             )
 
             message_id = await self.service.send_message(request)
-            logger.info(f"✅ Email sent successfully: {message_id}")
+            logger.info("✅ Email sent successfully: %s", message_id)
 
             return {
                 "success": True,
@@ -273,13 +273,13 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error sending email: {e}")
+            logger.error("❌ Error sending email: %s", e)
             return {"success": False, "error": str(e)}
 
     async def mark_as_read(self, message_id: str) -> dict:
         """Mark an email as read."""
         try:
-            logger.info(f"👁️  Marking email {message_id} as read")
+            logger.info("👁️  Marking email %s as read", message_id)
 
             request = ModifyLabelsRequest(remove_label_ids=["UNREAD"])
             await self.service.modify_message_labels(message_id, request)
@@ -287,13 +287,13 @@ class GmailTester:
             return {"success": True, "message_id": message_id, "message": "Email marked as read"}
 
         except Exception as e:
-            logger.error(f"❌ Error marking as read: {e}")
+            logger.error("❌ Error marking as read: %s", e)
             return {"success": False, "error": str(e)}
 
     async def mark_as_unread(self, message_id: str) -> dict:
         """Mark an email as unread."""
         try:
-            logger.info(f"✉️  Marking email {message_id} as unread")
+            logger.info("✉️  Marking email %s as unread", message_id)
 
             request = ModifyLabelsRequest(add_label_ids=["UNREAD"])
             await self.service.modify_message_labels(message_id, request)
@@ -301,13 +301,13 @@ class GmailTester:
             return {"success": True, "message_id": message_id, "message": "Email marked as unread"}
 
         except Exception as e:
-            logger.error(f"❌ Error marking as unread: {e}")
+            logger.error("❌ Error marking as unread: %s", e)
             return {"success": False, "error": str(e)}
 
     async def archive_email(self, message_id: str) -> dict:
         """Archive an email (remove from INBOX)."""
         try:
-            logger.info(f"📦 Archiving email {message_id}")
+            logger.info("📦 Archiving email %s", message_id)
 
             request = ModifyLabelsRequest(remove_label_ids=["INBOX"])
             await self.service.modify_message_labels(message_id, request)
@@ -319,13 +319,13 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error archiving email: {e}")
+            logger.error("❌ Error archiving email: %s", e)
             return {"success": False, "error": str(e)}
 
     async def unarchive_email(self, message_id: str) -> dict:
         """Unarchive an email (add back to INBOX)."""
         try:
-            logger.info(f"📥 Unarchiving email {message_id}")
+            logger.info("📥 Unarchiving email %s", message_id)
 
             # Import ModifyLabelsRequest
             from gmail_mcp.models import ModifyLabelsRequest
@@ -340,13 +340,13 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error unarchiving email: {e}")
+            logger.error("❌ Error unarchiving email: %s", e)
             return {"success": False, "error": str(e)}
 
     async def delete_email(self, message_id: str) -> dict:
         """Delete an email permanently."""
         try:
-            logger.info(f"🗑️  Deleting email {message_id}")
+            logger.info("🗑️  Deleting email %s", message_id)
 
             success = await self.service.delete_message(message_id)
 
@@ -364,7 +364,7 @@ class GmailTester:
                 }
 
         except Exception as e:
-            logger.error(f"❌ Error deleting email: {e}")
+            logger.error("❌ Error deleting email: %s", e)
             return {"success": False, "error": str(e)}
 
     # === ADVANCED FUNCTIONS ===
@@ -385,7 +385,7 @@ class GmailTester:
             if not body_text and not body_html:
                 return {"success": False, "error": "Either body_text or body_html is required"}
 
-            logger.info(f"📝 Creating draft to {', '.join(to)}: '{subject}'")
+            logger.info("📝 Creating draft to %s: '%s'", ', '.join(to), subject)
 
             request = CreateDraftRequest(
                 to=to,
@@ -399,7 +399,7 @@ class GmailTester:
             )
 
             draft_id = await self.service.create_draft(request)
-            logger.info(f"✅ Draft created successfully: {draft_id}")
+            logger.info("✅ Draft created successfully: %s", draft_id)
 
             return {
                 "success": True,
@@ -408,7 +408,7 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error creating draft: {e}")
+            logger.error("❌ Error creating draft: %s", e)
             return {"success": False, "error": str(e)}
 
     async def get_drafts(
@@ -421,7 +421,7 @@ class GmailTester:
     ) -> dict:
         """Get list of draft emails."""
         try:
-            logger.info(f"📝 Getting {max_results} drafts")
+            logger.info("📝 Getting %s drafts", max_results)
 
             # Import DraftListRequest
             from gmail_mcp.models import DraftListRequest
@@ -435,7 +435,7 @@ class GmailTester:
             )
 
             response = await self.service.list_drafts(request)
-            logger.info(f"✅ Retrieved {len(response.drafts)} drafts")
+            logger.info("✅ Retrieved %s drafts", len(response.drafts))
 
             return {
                 "success": True,
@@ -445,16 +445,16 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error getting drafts: {e}")
+            logger.error("❌ Error getting drafts: %s", e)
             return {"success": False, "error": str(e)}
 
     async def get_draft_by_id(self, draft_id: str, format: str = "full") -> dict:
         """Get a specific draft by ID."""
         try:
-            logger.info(f"📝 Getting draft by ID: {draft_id}")
+            logger.info("📝 Getting draft by ID: %s", draft_id)
 
             draft = await self.service.get_draft(draft_id, format)
-            logger.info(f"✅ Retrieved draft")
+            logger.info("✅ Retrieved draft")
 
             return {
                 "success": True,
@@ -463,7 +463,7 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error getting draft by ID: {e}")
+            logger.error("❌ Error getting draft by ID: %s", e)
             return {"success": False, "error": str(e)}
 
     async def reply_to_email(
@@ -475,7 +475,7 @@ class GmailTester:
     ) -> dict:
         """Reply to an email."""
         try:
-            logger.info(f"📧 Replying to email: {message_id}")
+            logger.info("📧 Replying to email: %s", message_id)
 
             if not body_text and not body_html:
                 return {"success": False, "error": "Either body_text or body_html must be provided"}
@@ -508,7 +508,7 @@ class GmailTester:
             )
 
             reply_message_id = await self.service.send_message(request)
-            logger.info(f"✅ Reply sent with ID: {reply_message_id}")
+            logger.info("✅ Reply sent with ID: %s", reply_message_id)
 
             return {
                 "success": True,
@@ -518,7 +518,7 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error replying to email: {e}")
+            logger.error("❌ Error replying to email: %s", e)
             return {"success": False, "error": str(e)}
 
     async def forward_email(
@@ -531,7 +531,7 @@ class GmailTester:
     ) -> dict:
         """Forward an email."""
         try:
-            logger.info(f"📧 Forwarding email: {message_id}")
+            logger.info("📧 Forwarding email: %s", message_id)
 
             forward_email_request = ForwardEmailRequest(
                 to=to,
@@ -541,7 +541,7 @@ class GmailTester:
             )
 
             response = await self.service.forward_message(message_id, forward_email_request)
-            logger.info(f"✅ Email forwarded with ID: {response}")
+            logger.info("✅ Email forwarded with ID: %s", response)
 
             return {
                 "success": True,
@@ -549,7 +549,7 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error forwarding email: {e}")
+            logger.error("❌ Error forwarding email: %s", e)
             return {"success": False, "error": str(e)}
 
     async def move_to_folder(
@@ -557,7 +557,7 @@ class GmailTester:
     ) -> dict:
         """Move email to folder/label."""
         try:
-            logger.info(f"📁 Moving email {message_id} to folder {folder_label_id}")
+            logger.info("📁 Moving email %s to folder %s", message_id, folder_label_id)
 
             # Import ModifyLabelsRequest
             from gmail_mcp.models import ModifyLabelsRequest
@@ -574,7 +574,7 @@ class GmailTester:
             )
 
             updated_message = await self.service.modify_message_labels(message_id, request)
-            logger.info(f"✅ Email moved successfully")
+            logger.info("✅ Email moved successfully")
 
             return {
                 "success": True,
@@ -585,7 +585,7 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error moving email: {e}")
+            logger.error("❌ Error moving email: %s", e)
             return {"success": False, "error": str(e)}
 
     async def get_threads(
@@ -599,7 +599,7 @@ class GmailTester:
     ) -> dict:
         """Get threads."""
         try:
-            logger.info(f"🧵 Getting {max_results} threads")
+            logger.info("🧵 Getting %s threads", max_results)
 
             # Import ThreadListRequest
             from gmail_mcp.models import ThreadListRequest
@@ -615,7 +615,7 @@ class GmailTester:
             )
 
             response = await self.service.list_threads(list_threads_request)
-            logger.info(f"✅ Retrieved {len(response.threads)} threads")
+            logger.info("✅ Retrieved %s threads", len(response.threads))
 
             return {
                 "success": True,
@@ -625,7 +625,7 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error getting threads: {e}")
+            logger.error("❌ Error getting threads: %s", e)
             return {"success": False, "error": str(e)}
 
     async def get_thread_by_id(
@@ -635,10 +635,10 @@ class GmailTester:
     ) -> dict:
         """Get a specific thread by ID."""
         try:
-            logger.info(f"🧵 Getting thread by ID: {thread_id}")
+            logger.info("🧵 Getting thread by ID: %s", thread_id)
 
             thread = await self.service.get_thread(thread_id, format)
-            logger.info(f"✅ Retrieved thread with {len(thread.messages)} messages")
+            logger.info("✅ Retrieved thread with %s messages", len(thread.messages))
 
             return {
                 "success": True,
@@ -647,16 +647,16 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error getting thread by ID: {e}")
+            logger.error("❌ Error getting thread by ID: %s", e)
             return {"success": False, "error": str(e)}
 
     async def send_draft(self, draft_id: str) -> dict:
         """Send a draft email."""
         try:
-            logger.info(f"📧 Sending draft: {draft_id}")
+            logger.info("📧 Sending draft: %s", draft_id)
 
             response = await self.service.send_draft(draft_id)
-            logger.info(f"✅ Draft sent with ID: {response}")
+            logger.info("✅ Draft sent with ID: %s", response)
 
             return {
                 "success": True,
@@ -664,17 +664,17 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error sending draft: {e}")
+            logger.error("❌ Error sending draft: %s", e)
             return {"success": False, "error": str(e)}
 
     async def get_attachments(self, message_id: str) -> dict:
         """Get attachments from an email."""
         try:
-            logger.info(f"📎 Getting attachments from email: {message_id}")
+            logger.info("📎 Getting attachments from email: %s", message_id)
 
             # Get message to list all attachments
             message = await self.service.get_message(message_id)
-            logger.info(f"✅ Retrieved {len(message.attachments)} attachments")
+            logger.info("✅ Retrieved %s attachments", len(message.attachments))
 
             return {
                 "success": True,
@@ -684,20 +684,20 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error getting attachments: {e}")
+            logger.error("❌ Error getting attachments: %s", e)
             return {"success": False, "error": str(e)}
 
     async def add_label(self, message_id: str, label_ids: List[str]) -> dict:
         """Add labels to an email."""
         try:
-            logger.info(f"🏷️ Adding labels to email: {message_id}")
+            logger.info("🏷️ Adding labels to email: %s", message_id)
 
             # Import ModifyLabelsRequest
             from gmail_mcp.models import ModifyLabelsRequest
 
             request = ModifyLabelsRequest(add_label_ids=label_ids)
             updated_message = await self.service.modify_message_labels(message_id, request)
-            logger.info(f"✅ Labels added successfully")
+            logger.info("✅ Labels added successfully")
 
             return {
                 "success": True,
@@ -708,23 +708,23 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error adding labels: {e}")
+            logger.error("❌ Error adding labels: %s", e)
             return {"success": False, "error": str(e)}
 
     async def remove_label(self, message_id: str, label_ids: List[str]) -> dict:
         """Remove labels from an email."""
         try:
-            logger.info(f"🏷️ Removing labels from email: {message_id}")
+            logger.info("🏷️ Removing labels from email: %s", message_id)
 
             request = ModifyLabelsRequest(remove_label_ids=label_ids)
 
             response = await self.service.modify_message_labels(message_id, request)
-            logger.info(f"✅ Labels removed successfully")
+            logger.info("✅ Labels removed successfully")
 
             return {"success": True, "message": response}
 
         except Exception as e:
-            logger.error(f"❌ Error removing labels: {e}")
+            logger.error("❌ Error removing labels: %s", e)
             return {"success": False, "error": str(e)}
 
     async def create_label(
@@ -735,7 +735,7 @@ class GmailTester:
     ) -> dict:
         """Create a new label."""
         try:
-            logger.info(f"🏷️ Creating label: {name}")
+            logger.info("🏷️ Creating label: %s", name)
 
             request = CreateLabelRequest(
                 name=name,
@@ -744,7 +744,7 @@ class GmailTester:
             )
 
             response = await self.service.create_label(request)
-            logger.info(f"✅ Label created with ID: {response.id}")
+            logger.info("✅ Label created with ID: %s", response.id)
 
             return {
                 "success": True,
@@ -753,7 +753,7 @@ class GmailTester:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error creating label: {e}")
+            logger.error("❌ Error creating label: %s", e)
             return {"success": False, "error": str(e)}
 
 
@@ -15,9 +15,9 @@ try:
     def main():
         """Start the Gmail MCP Server."""
         logger.info("🚀 Starting Gmail MCP Server...")
-        logger.info(f"📍 Server: {settings.server_host}:{settings.server_port}")
-        logger.info(f"📧 Required Scopes: {len(settings.required_scopes)} scopes")
-        logger.info(f"🔧 Debug Mode: {settings.debug}")
+        logger.info("📍 Server: %s:%s", settings.server_host, settings.server_port)
+        logger.info("📧 Required Scopes: %s scopes", len(settings.required_scopes))
+        logger.info("🔧 Debug Mode: %s", settings.debug)
 
         uvicorn.run(
             "main:app",
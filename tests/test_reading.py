@@ -0,0 +1,72 @@
+"""Tests for the Gmail reading tools."""
+
+import re
+
+import httpx
+import orjson
+import pytest
+
+from gmail_mcp.auth import TokenInfo
+from gmail_mcp.models import MessageFormat
+from gmail_mcp.services import GmailService
+from gmail_mcp.tools import reading
+
+NOT_FOUND = orjson.dumps(
+    {"error": {"code": 404, "message": "Requested entity was not found.", "errors": []}}
+).decode()
+
+
+def _message(message_id: str) -> str:
+    """Build a minimal Gmail API message resource."""
+    return orjson.dumps(
+        {
+            "id": message_id,
+            "threadId": "thread",
+            "labelIds": ["INBOX"],
+            "payload": {
+                "mimeType": "text/plain",
+                "headers": [{"name": "Subject", "value": f"Subject {message_id}"}],
+                "body": {"data": "aGk"},
+            },
+        }
+    ).decode()
+
+
+def _batch_handler(request: httpx.Request) -> httpx.Response:
+    """Answer a Gmail batch request, reporting message "deleted" as not found."""
+    boundary = re.search(r'boundary="?([^";]+)', request.headers["content-type"]).group(1)
+    parts = []
+    for part in request.content.decode().split(f"--{boundary}")[1:-1]:
+        content_id = re.search(r"Content-ID: <(.*?)>", part).group(1)
+        message_id = re.search(r"/messages/(\w+)", part).group(1)
+        if message_id == "deleted":
+            status, body = "404 Not Found", NOT_FOUND
+        else:
+            status, body = "200 OK", _message(message_id)
+        parts.append(
+            f"--B\r\nContent-Type: application/http\r\nContent-ID: <response-{content_id}>\r\n\r\n"
+            f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n\r\n{body}\r\n"
+        )
+    return httpx.Response(
+        200,
+        headers={"content-type": "multipart/mixed; boundary=B"},
+        content="".join(parts) + "--B--\r\n",
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_emails_by_ids_reports_invalid_ids(monkeypatch):
+    service = GmailService(TokenInfo(access_token="token", email="", scope=""))
+    monkeypatch.setattr(
+        service._http.http, "_client", httpx.Client(transport=httpx.MockTransport(_batch_handler))
+    )
+    monkeypatch.setattr(reading, "get_context_gmail_service", lambda ctx: service)
+
+    response = orjson.loads(
+        await reading.gmail_get_emails_by_ids(
+            None, ["first", "deleted", "second"], MessageFormat.COMPACT
+        )
+    )
+
+    assert [message["id"] for message in response["messages"]] == ["first", "second"]
+    assert response["errors"] == {"deleted": "Requested entity was not found."}